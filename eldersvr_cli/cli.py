@@ -9,12 +9,53 @@ import sys
 import os
 import json
 import glob
+import hashlib
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 
+from .config import get_default_config_mut, read_config_file
 from .core import ADBManager, ContentManager
 from .utils import setup_logger, get_logger, TransferProgress, print_deployment_summary
 
 
+# Configuration validation rules, compiled once at import
+_URL_RE = re.compile(r'^https?://')
+_ENDPOINT_RE = re.compile(r'^/')
+
+_REQUIRED_SECTIONS = ('backend', 'paths', 'devices', 'auth')
+_REQUIRED_BACKEND_KEYS = ('api_url', 'auth_endpoint', 'tags_endpoint', 'films_endpoint')
+_REQUIRED_PATH_KEYS = ('local_downloads', 'device_path', 'json_filename')
+
+# (backend key, pattern, issue) checked whenever the key has a non-empty value
+_BACKEND_FORMAT_RULES = (
+    ('api_url', _URL_RE, "Invalid api_url format: must start with http:// or https://"),
+    ('auth_endpoint', _ENDPOINT_RE, "Invalid auth_endpoint: must start with /"),
+    ('tags_endpoint', _ENDPOINT_RE, "Invalid tags_endpoint: must start with /"),
+    ('films_endpoint', _ENDPOINT_RE, "Invalid films_endpoint: must start with /"),
+)
+
+# Preflight checks in reporting order, and the check each one waits on
+_PREFLIGHT_ORDER = ('config', 'api', 'auth', 'data', 'devices')
+_PREFLIGHT_DEPENDENCIES = {'auth': 'api'}
+_PREFLIGHT_WORKERS = 4
+
+# Seconds a passing preflight check is reused before probing again
+PREFLIGHT_TTL = {
+    'config': 300,
+    'api': 30,
+    'devices': 5,
+}
+
+# Config section each cached check depends on (None = whole config)
+_PREFLIGHT_CACHE_SECTIONS = {
+    'config': None,
+    'api': 'backend',
+    'devices': 'devices',
+}
+
+
 class EldersVRCLI:
     """Main CLI application class"""
 
@@ -25,6 +66,9 @@ class EldersVRCLI:
         self.logger = setup_logger('eldersvr-cli')
         # File conflict handling state
         self._conflict_action_all = None  # 'skip_all', 'override_all', or None
+        # Preflight memo: kind -> (config slice digest, monotonic time of last pass)
+        self._preflight_cache: Dict[str, tuple] = {}
+        self._preflight_ttl: Dict[str, float] = dict(PREFLIGHT_TTL)
 
     def load_config(self, config_path: str = None) -> Dict[str, Any]:
         """Load configuration from file with enhanced validation and logging"""
@@ -58,27 +102,27 @@ class EldersVRCLI:
                 return self._fallback_to_default_config()
 
             try:
-                with open(config_path, 'r') as f:
-                    loaded_config = json.load(f)
-                    self.logger.info(f"✅ Successfully loaded configuration from {config_path}")
+                # Reuses the previous parse while the file's mtime is unchanged
+                loaded_config = read_config_file(config_path)
+                self.logger.info(f"✅ Successfully loaded configuration from {config_path}")
 
-                    # Merge with default config to ensure all required keys exist
-                    self.config = self._merge_with_default_config(loaded_config)
+                # Merge with default config to ensure all required keys exist
+                self.config = self._merge_with_default_config(loaded_config)
 
-                    # Validate the loaded configuration
-                    validation_issues = self._validate_config(self.config)
-                    if validation_issues:
-                        self.logger.warning("Configuration validation issues found:")
-                        for issue in validation_issues:
-                            self.logger.warning(f"  - {issue}")
+                # Validate the loaded configuration
+                validation_issues = self._validate_config(self.config)
+                if validation_issues:
+                    self.logger.warning("Configuration validation issues found:")
+                    for issue in validation_issues:
+                        self.logger.warning(f"  - {issue}")
 
-                    self.logger.info("Configuration summary:")
-                    self.logger.info(f"  API URL: {self.config['backend']['api_url']}")
-                    self.logger.info(f"  Device path: {self.config['paths']['device_path']}")
-                    self.logger.info(f"  Local downloads: {self.config['paths']['local_downloads']}")
+                self.logger.info("Configuration summary:")
+                self.logger.info(f"  API URL: {self.config['backend']['api_url']}")
+                self.logger.info(f"  Device path: {self.config['paths']['device_path']}")
+                self.logger.info(f"  Local downloads: {self.config['paths']['local_downloads']}")
 
-                    self._initialize_managers()
-                    return self.config
+                self._initialize_managers()
+                return self.config
 
             except json.JSONDecodeError as e:
                 self.logger.error(f"❌ Invalid JSON in config file {config_path}: {e}")
@@ -160,33 +204,26 @@ class EldersVRCLI:
         issues = []
 
         # Required sections
-        required_sections = ['backend', 'paths', 'devices', 'auth']
-        for section in required_sections:
+        for section in _REQUIRED_SECTIONS:
             if section not in config:
                 issues.append(f"Missing required section: {section}")
 
         # Backend validation
         if 'backend' in config:
-            required_backend_keys = ['api_url', 'auth_endpoint', 'tags_endpoint', 'films_endpoint']
-            for key in required_backend_keys:
-                if key not in config['backend']:
+            backend = config['backend']
+            for key in _REQUIRED_BACKEND_KEYS:
+                if key not in backend:
                     issues.append(f"Missing required backend key: {key}")
 
-            # Validate api_url format
-            api_url = config['backend'].get('api_url', '')
-            if api_url and not api_url.startswith(('http://', 'https://')):
-                issues.append(f"Invalid api_url format: must start with http:// or https://")
-
-            # Validate endpoints start with /
-            for ep_key in ['auth_endpoint', 'tags_endpoint', 'films_endpoint']:
-                ep_val = config['backend'].get(ep_key, '')
-                if ep_val and not ep_val.startswith('/'):
-                    issues.append(f"Invalid {ep_key}: must start with /")
+            # Validate api_url and endpoint formats
+            for key, pattern, issue in _BACKEND_FORMAT_RULES:
+                value = backend.get(key, '')
+                if value and not pattern.match(value):
+                    issues.append(issue)
 
         # Paths validation
         if 'paths' in config:
-            required_path_keys = ['local_downloads', 'device_path', 'json_filename']
-            for key in required_path_keys:
+            for key in _REQUIRED_PATH_KEYS:
                 if key not in config['paths']:
                     issues.append(f"Missing required paths key: {key}")
 
@@ -214,6 +251,31 @@ class EldersVRCLI:
 
         return issues
 
+    def _preflight_cache_key(self, kind: str) -> bytes:
+        """Digest of the config slice a cached preflight check depends on"""
+        section = _PREFLIGHT_CACHE_SECTIONS[kind]
+        relevant = self.config if section is None else self.config.get(section)
+        return hashlib.blake2b(repr(relevant).encode(), digest_size=16).digest()
+
+    def _preflight_cached(self, kind: str) -> bool:
+        """Check whether a recent pass for this check kind is still valid.
+
+        Entries expire after the kind's TTL, and are ignored as soon as the
+        relevant config slice changes.
+        """
+        ttl = self._preflight_ttl.get(kind, 0)
+        entry = self._preflight_cache.get(kind)
+        if not ttl or entry is None:
+            return False
+        key, passed_at = entry
+        return (time.monotonic() - passed_at < ttl
+                and key == self._preflight_cache_key(kind))
+
+    def _preflight_remember(self, kind: str):
+        """Record a passing preflight check"""
+        if self._preflight_ttl.get(kind, 0):
+            self._preflight_cache[kind] = (self._preflight_cache_key(kind), time.monotonic())
+
     def _preflight_check(self, checks: List[str]) -> bool:
         """Run preflight validation checks before a command.
 
@@ -225,115 +287,45 @@ class EldersVRCLI:
                 'data'   - Validate local new_data.json exists and is valid
                 'devices'- Verify configured devices are connected
 
+        Independent checks run concurrently; auth waits for the api check
+        and is skipped if the API is unreachable. Results are logged in the
+        order above once all checks finish.
+
+        Passing 'config', 'api' and 'devices' results are memoized for
+        PREFLIGHT_TTL seconds so back-to-back commands skip re-probing.
+
         Returns:
             True if all checks passed, False otherwise.
         """
         if not self.config:
             self.load_config()
 
-        all_passed = True
         self.logger.info("Running preflight checks...")
 
-        # Config check
-        if 'config' in checks:
-            config_issues = self._validate_config(self.config)
-            if config_issues:
-                self.logger.error("[FAIL] Configuration validation:")
-                for issue in config_issues:
-                    self.logger.error(f"       - {issue}")
-                all_passed = False
-            else:
-                self.logger.info("[PASS] Configuration valid")
+        kinds = [kind for kind in _PREFLIGHT_ORDER
+                 if kind in checks or (kind == 'api' and 'auth' in checks)]
 
-        # API connectivity check
-        if 'api' in checks or 'auth' in checks:
-            if not self.content_manager:
-                self.content_manager = ContentManager(self.config)
-            reachable, msg = self.content_manager.check_api_connectivity()
-            if not reachable:
-                self.logger.error(f"[FAIL] {msg}")
-                all_passed = False
-                # If API is unreachable, skip auth check since it depends on API
-                if 'auth' in checks:
-                    self.logger.error("[SKIP] Auth validation skipped (API unreachable)")
-                return all_passed
-            else:
-                self.logger.info(f"[PASS] {msg}")
-
-        # Auth token check
-        if 'auth' in checks:
-            if not self.content_manager:
-                self.content_manager = ContentManager(self.config)
-            valid, msg = self.content_manager.validate_token()
-            if not valid:
-                self.logger.error(f"[FAIL] {msg}")
-                all_passed = False
-            else:
-                self.logger.info(f"[PASS] {msg}")
-
-        # Local data check
-        if 'data' in checks:
-            json_file = os.path.join(
-                self.config['paths']['local_downloads'],
-                self.config['paths']['json_filename']
-            )
-            if not os.path.exists(json_file):
-                self.logger.error(f"[FAIL] {json_file} not found - run 'fetch-data' first")
-                all_passed = False
-            else:
-                try:
-                    with open(json_file, 'r') as f:
-                        data = json.load(f)
-                    if not self.content_manager:
-                        self.content_manager = ContentManager(self.config)
-                    issues = self.content_manager.validate_json_data(data)
-                    if issues:
-                        self.logger.error("[FAIL] Data validation issues:")
-                        for issue in issues:
-                            self.logger.error(f"       - {issue}")
-                        all_passed = False
-                    else:
-                        self.logger.info(f"[PASS] {json_file} is valid")
-                except (json.JSONDecodeError, IOError) as e:
-                    self.logger.error(f"[FAIL] Cannot read {json_file}: {e}")
-                    all_passed = False
-
-        # Device connectivity check
-        if 'devices' in checks:
+        # Shared managers are created up front so check threads never race to build them
+        if not self.content_manager and {'api', 'auth', 'data'} & set(kinds):
+            self.content_manager = ContentManager(self.config)
+        if 'devices' in kinds:
             self._ensure_managers_initialized()
-            master = self.config['devices'].get('master_serial', '')
-            slave = self.config['devices'].get('slave_serial', '')
 
-            if not master and not slave:
-                self.logger.error("[FAIL] No devices configured - run 'select-devices' first")
+        reports: Dict[str, List[tuple]] = {kind: [] for kind in kinds}
+        futures: Dict[str, Future] = {}
+        with ThreadPoolExecutor(max_workers=_PREFLIGHT_WORKERS) as pool:
+            # Kinds are submitted in dependency order, so a dependency is always
+            # picked up by a worker before the check waiting on it
+            for kind in kinds:
+                dependency = futures.get(_PREFLIGHT_DEPENDENCIES.get(kind))
+                futures[kind] = pool.submit(self._run_preflight_step, kind, reports[kind], dependency)
+
+        all_passed = True
+        for kind in kinds:
+            for level, message in reports[kind]:
+                getattr(self.logger, level)(message)
+            if not futures[kind].result():
                 all_passed = False
-            else:
-                try:
-                    connected = self.adb_manager.get_connected_devices()
-                    connected_serials = [d['serial'] for d in connected]
-                    disconnected_count = 0
-
-                    if master:
-                        if master in connected_serials:
-                            self.logger.info(f"[PASS] Master device {master} connected")
-                        else:
-                            self.logger.warning(f"[WARN] Master device {master} not connected")
-                            disconnected_count += 1
-                    if slave:
-                        if slave in connected_serials:
-                            self.logger.info(f"[PASS] Slave device {slave} connected")
-                        else:
-                            self.logger.warning(f"[WARN] Slave device {slave} not connected")
-                            disconnected_count += 1
-
-                    # Count how many devices are configured
-                    configured_count = bool(master) + bool(slave)
-                    if disconnected_count >= configured_count:
-                        self.logger.error("[FAIL] No configured devices are connected")
-                        all_passed = False
-                except Exception as e:
-                    self.logger.error(f"[FAIL] Device check failed: {e}")
-                    all_passed = False
 
         if all_passed:
             self.logger.info("All preflight checks passed")
@@ -342,30 +334,131 @@ class EldersVRCLI:
 
         return all_passed
 
+    def _run_preflight_step(self, kind: str, report: List[tuple],
+                            dependency: Optional[Future] = None) -> bool:
+        """Run one preflight check, collecting (level, message) log lines in report"""
+        if dependency is not None and not dependency.result():
+            report.append(('error', "[SKIP] Auth validation skipped (API unreachable)"))
+            return False
+        return getattr(self, f'_preflight_{kind}')(report)
+
+    def _preflight_config(self, report: List[tuple]) -> bool:
+        """Validate configuration completeness and values"""
+        if self._preflight_cached('config'):
+            report.append(('info', "[PASS] Configuration valid (cached)"))
+            return True
+
+        config_issues = self._validate_config(self.config)
+        if config_issues:
+            report.append(('error', "[FAIL] Configuration validation:"))
+            for issue in config_issues:
+                report.append(('error', f"       - {issue}"))
+            return False
+
+        report.append(('info', "[PASS] Configuration valid"))
+        self._preflight_remember('config')
+        return True
+
+    def _preflight_api(self, report: List[tuple]) -> bool:
+        """Test API connectivity"""
+        if self._preflight_cached('api'):
+            report.append(('info', "[PASS] API reachable (cached)"))
+            return True
+
+        reachable, msg = self.content_manager.check_api_connectivity()
+        if not reachable:
+            report.append(('error', f"[FAIL] {msg}"))
+            return False
+
+        report.append(('info', f"[PASS] {msg}"))
+        self._preflight_remember('api')
+        return True
+
+    def _preflight_auth(self, report: List[tuple]) -> bool:
+        """Verify the stored auth token is accepted by the API"""
+        valid, msg = self.content_manager.validate_token()
+        if not valid:
+            report.append(('error', f"[FAIL] {msg}"))
+            return False
+
+        report.append(('info', f"[PASS] {msg}"))
+        return True
+
+    def _preflight_data(self, report: List[tuple]) -> bool:
+        """Validate that the local new_data.json exists and is valid"""
+        json_file = os.path.join(
+            self.config['paths']['local_downloads'],
+            self.config['paths']['json_filename']
+        )
+        if not os.path.exists(json_file):
+            report.append(('error', f"[FAIL] {json_file} not found - run 'fetch-data' first"))
+            return False
+
+        try:
+            with open(json_file, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            report.append(('error', f"[FAIL] Cannot read {json_file}: {e}"))
+            return False
+
+        issues = self.content_manager.validate_json_data(data)
+        if issues:
+            report.append(('error', "[FAIL] Data validation issues:"))
+            for issue in issues:
+                report.append(('error', f"       - {issue}"))
+            return False
+
+        report.append(('info', f"[PASS] {json_file} is valid"))
+        return True
+
+    def _preflight_devices(self, report: List[tuple]) -> bool:
+        """Verify configured devices are connected"""
+        if self._preflight_cached('devices'):
+            report.append(('info', "[PASS] Configured devices connected (cached)"))
+            return True
+
+        master = self.config['devices'].get('master_serial', '')
+        slave = self.config['devices'].get('slave_serial', '')
+
+        if not master and not slave:
+            report.append(('error', "[FAIL] No devices configured - run 'select-devices' first"))
+            return False
+
+        try:
+            connected = self.adb_manager.get_connected_devices()
+        except Exception as e:
+            report.append(('error', f"[FAIL] Device check failed: {e}"))
+            return False
+
+        connected_serials = [d['serial'] for d in connected]
+        disconnected_count = 0
+
+        if master:
+            if master in connected_serials:
+                report.append(('info', f"[PASS] Master device {master} connected"))
+            else:
+                report.append(('warning', f"[WARN] Master device {master} not connected"))
+                disconnected_count += 1
+        if slave:
+            if slave in connected_serials:
+                report.append(('info', f"[PASS] Slave device {slave} connected"))
+            else:
+                report.append(('warning', f"[WARN] Slave device {slave} not connected"))
+                disconnected_count += 1
+
+        # Count how many devices are configured
+        configured_count = bool(master) + bool(slave)
+        if disconnected_count >= configured_count:
+            report.append(('error', "[FAIL] No configured devices are connected"))
+            return False
+
+        if disconnected_count == 0:
+            self._preflight_remember('devices')
+        return True
+
     def _get_default_config(self) -> Dict[str, Any]:
-        """Get default configuration"""
-        return {
-            "backend": {
-                "api_url": "https://api.eldersvr.com",
-                "auth_endpoint": "/integration/auth/login",
-                "tags_endpoint": "/integration/tags",
-                "films_endpoint": "/integration/films"
-            },
-            "paths": {
-                "local_downloads": "./downloads",
-                "device_path": "/storage/emulated/0/Android/data/com.q42.eldersvr/files/EldersVR",
-                "json_filename": "new_data.json"
-            },
-            "devices": {
-                "master_serial": "",
-                "slave_serial": ""
-            },
-            "auth": {
-                "username": "",
-                "email": "clionboarding@eldervr.com",
-                "password": "clionboarding@eldervr.com"
-            }
-        }
+        """Get a private, mutable copy of the default configuration"""
+        return get_default_config_mut()
 
     def _initialize_managers(self):
         """Initialize managers with configuration"""
@@ -895,10 +988,11 @@ class EldersVRCLI:
         progress = TransferProgress()
 
         # Only add devices to progress tracker if they will be processed
+        has_media = not args.json_only
         if master_serial and not args.slave_only:
-            progress.add_device(master_serial, "Master")
+            progress.add_device(master_serial, "Master", has_videos=has_media, has_images=has_media)
         if slave_serial and not args.master_only:
-            progress.add_device(slave_serial, "Slave")
+            progress.add_device(slave_serial, "Slave", has_videos=has_media, has_images=has_media)
 
         success = True
 
@@ -2,9 +2,16 @@
 Configuration utilities for EldersVR CLI
 """
 
+import copy
+import functools
 import json
 import os
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
+
+
+# Parsed config files by absolute path, with the mtime they were read at
+_config_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
 
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
@@ -26,17 +33,69 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     
     if config_path and os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return read_config_file(config_path)
         except (json.JSONDecodeError, IOError):
             pass
     
     # Return default configuration
-    return get_default_config()
+    return get_default_config_mut()
+
+
+def read_config_file(config_path: str) -> Dict[str, Any]:
+    """Parse a config file into a private copy, reusing the last parse while its mtime is unchanged.
+
+    Raises json.JSONDecodeError for invalid JSON and IOError if the file
+    cannot be read.
+    """
+    return copy.deepcopy(_read_config_file(config_path))
+
+
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+    """Parse a config file through the mtime cache (the result is shared; never hand out directly)"""
+    cache_key = os.path.abspath(config_path)
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    cached = _config_cache.get(cache_key)
+    if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with open(config_path, 'r') as f:
+        config = json.load(f)
+
+    if mtime_ns is not None:
+        _config_cache[cache_key] = (mtime_ns, config)
+    return config
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_config() -> Mapping[str, Any]:
+    """Get default configuration as a cached, read-only mapping.
+
+    Use get_default_config_mut() when the result needs to be modified.
+    """
+    return _freeze(_build_default_config())
+
+
+def get_default_config_mut() -> Dict[str, Any]:
+    """Get a private, mutable copy of the default configuration"""
+    return copy.deepcopy(_build_default_config())
 
 
-def get_default_config() -> Dict[str, Any]:
-    """Get default configuration"""
+@functools.lru_cache(maxsize=1)
+def _build_default_config() -> Dict[str, Any]:
+    """Build the default configuration (cached; never hand out directly)"""
     return {
         "backend": {
             "api_url": "https://api.eldersvr.com",
@@ -46,7 +105,7 @@ def get_default_config() -> Dict[str, Any]:
         },
         "paths": {
             "local_downloads": "./downloads",
-            "device_path": "/storage/emulated/0/Download/EldersVR",
+            "device_path": "/storage/emulated/0/Android/data/com.q42.eldersvr/files/EldersVR",
             "json_filename": "new_data.json"
         },
         "devices": {
@@ -70,9 +129,11 @@ def save_config(config: Dict[str, Any], config_path: str = './eldersvr_config.js
         with open(config_path, 'w') as f:
             json.dump(config, f, indent=2)
         
+        # Don't rely on the mtime changing within the filesystem's timestamp granularity
+        _config_cache.pop(os.path.abspath(config_path), None)
         return True
     except (IOError, TypeError):
         return False
 
 
-__all__ = ['load_config', 'get_default_config', 'save_config']
\ No newline at end of file
+__all__ = ['load_config', 'read_config_file', 'get_default_config', 'get_default_config_mut', 'save_config']
\ No newline at end of file
@@ -6,11 +6,35 @@ Handles ADB connectivity, storage verification, and file transfers
 import subprocess
 import os
 import glob
+import re
+import shlex
+import shutil
+import socket
+import tarfile
 import time
 from typing import List, Tuple, Optional, Dict, Any
 from ..utils import get_logger
 
 
+# Local ADB server (host side of the adb client/server protocol). The port
+# follows ANDROID_ADB_SERVER_PORT, like the adb binary itself.
+ADB_SERVER_HOST = "127.0.0.1"
+ADB_DEFAULT_SERVER_PORT = 5037
+
+# One `adb devices -l` row: serial, state, then key:value properties.
+# Matched with finditer over the whole output; the header line is excluded.
+_DEVICE_RE = re.compile(
+    r'^(?!List of devices)[ \t]*(?P<serial>\S+)[ \t]+(?P<status>\S+)(?P<props>[^\n]*)$',
+    re.MULTILINE
+)
+_DEVICE_PROP = re.compile(r'(?:^|\s)(model|product):([^\s:]*)')
+
+# Files per `adb exec-in` tar stream; progress is reported once per batch,
+# so video batches stay small enough for the display to keep moving
+_IMAGE_BATCH_SIZE = 70
+_VIDEO_BATCH_SIZE = 5
+
+
 class CLIAccessControl:
     """Security control for CLI-only operations"""
 
@@ -38,10 +62,12 @@ class CLIAccessControl:
 class ADBManager:
     """Manages ADB operations for EldersVR device onboarding"""
 
-    def __init__(self, device_path: str = "/storage/emulated/0/Android/data/com.q42.eldersvr/files/EldersVR"):
-        self.eldersvr_path = device_path
-        self.video_path = f"{self.eldersvr_path}/Video"
-        self.image_path = f"{self.eldersvr_path}/Image"
+    def __init__(self, device_path: str = "/storage/emulated/0/Android/data/com.q42.eldersvr/files/EldersVR",
+                 use_subprocess: bool = False):
+        # When False, host queries talk to the ADB server socket directly and
+        # only fall back to spawning the adb binary if the server is unreachable
+        self.use_subprocess = use_subprocess
+        self._set_device_path(device_path)
         self.logger = get_logger('ADBManager')
         
         # Fallback paths for different Android storage configurations
@@ -55,8 +81,82 @@ class ADBManager:
         # Track root status per device
         self._device_root_status = {}
 
+    def _set_device_path(self, device_path: str):
+        """Set the EldersVR base path and the remote paths derived from it"""
+        self.eldersvr_path = device_path
+        self.video_path = f"{device_path}/Video"
+        self.image_path = f"{device_path}/Image"
+        self.json_path = f"{device_path}/new_data.json"
+        self.credential_path = f"{device_path}/credential.json"
+        # Built once so push loops only do a single concatenation per file
+        self._video_prefix = self.video_path + "/"
+        self._image_prefix = self.image_path + "/"
+
+    def remote_video_path(self, filename: str) -> str:
+        """Remote path for a video file on the device"""
+        return self._video_prefix + filename
+
+    def remote_image_path(self, filename: str) -> str:
+        """Remote path for an image file on the device"""
+        return self._image_prefix + filename
+
+    def _adb_server_request(self, service: str, timeout: float = 10) -> str:
+        """Send a host service request to the ADB server and return its payload.
+
+        Raises OSError if the server is unreachable and RuntimeError if it
+        rejects the request.
+        """
+        request = service.encode('ascii')
+        with socket.create_connection(self._adb_server_address(), timeout=timeout) as sock:
+            # Requests and replies are prefixed with a 4-digit hex length
+            sock.sendall(b"%04x" % len(request) + request)
+            status = self._recv_exact(sock, 4)
+            length = int(self._recv_exact(sock, 4), 16)
+            payload = self._recv_exact(sock, length).decode('utf-8', errors='replace')
+
+        if status != b"OKAY":
+            raise RuntimeError(f"ADB server rejected '{service}': {payload}")
+        return payload
+
+    @staticmethod
+    def _adb_server_address() -> Tuple[str, int]:
+        """Address of the ADB server the adb binary would use.
+
+        Raises OSError for an invalid ANDROID_ADB_SERVER_PORT, so callers fall
+        back to the adb binary and surface its error.
+        """
+        port = os.environ.get('ANDROID_ADB_SERVER_PORT')
+        if not port:
+            return ADB_SERVER_HOST, ADB_DEFAULT_SERVER_PORT
+        try:
+            return ADB_SERVER_HOST, int(port)
+        except ValueError:
+            raise OSError(f"Invalid ANDROID_ADB_SERVER_PORT: {port!r}") from None
+
+    @staticmethod
+    def _recv_exact(sock: socket.socket, size: int) -> bytes:
+        """Read exactly size bytes from the socket"""
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("ADB server closed the connection")
+            data += chunk
+        return data
+
     def verify_adb_available(self) -> bool:
-        """Check if ADB is available in system PATH"""
+        """Check if the adb binary is in system PATH and works (or its server answers)"""
+        if not self.use_subprocess:
+            # Transfers, shell and root calls all run the adb binary, so a
+            # server started elsewhere (e.g. by Android Studio) is not enough
+            if shutil.which("adb") is None:
+                return False
+            try:
+                self._adb_server_request("host:version")
+                return True
+            except (OSError, RuntimeError, ValueError):
+                self.logger.debug("ADB server not reachable, falling back to adb binary")
+
         try:
             result = subprocess.run(["adb", "version"],
                                   capture_output=True, text=True, timeout=10)
@@ -146,6 +246,12 @@ class ADBManager:
 
     def get_connected_devices(self) -> List[Dict[str, str]]:
         """Get list of connected ADB devices with details"""
+        if not self.use_subprocess:
+            try:
+                return self._parse_devices_output(self._adb_server_request("host:devices-l", timeout=30))
+            except (OSError, ValueError):
+                self.logger.debug("ADB server not reachable, falling back to adb binary")
+
         if not self.verify_adb_available():
             raise RuntimeError("ADB is not available in system PATH")
 
@@ -156,37 +262,32 @@ class ADBManager:
             if result.returncode != 0:
                 raise RuntimeError(f"ADB devices command failed: {result.stderr}")
 
-            devices = []
-            lines = result.stdout.strip().split('\n')[1:]  # Skip header line
-
-            for line in lines:
-                if line.strip() and 'device' in line:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        serial = parts[0]
-                        status = parts[1]
-
-                        # Extract model info if available
-                        model = "Unknown"
-                        product = "Unknown"
-                        for part in parts[2:]:
-                            if part.startswith('model:'):
-                                model = part.split(':')[1]
-                            elif part.startswith('product:'):
-                                product = part.split(':')[1]
-
-                        devices.append({
-                            'serial': serial,
-                            'status': status,
-                            'model': model,
-                            'product': product
-                        })
-
-            return devices
+            return self._parse_devices_output(result.stdout)
 
         except subprocess.TimeoutExpired:
             raise RuntimeError("ADB devices command timed out")
 
+    def _parse_devices_output(self, output) -> List[Dict[str, str]]:
+        """Parse `adb devices -l` style output (str or raw bytes) into device dicts"""
+        if isinstance(output, bytes):
+            output = output.decode('utf-8', errors='replace')
+        devices = []
+
+        for match in _DEVICE_RE.finditer(output):
+            if 'device' not in match.group(0):
+                continue  # Not a device row (e.g. adb daemon startup notices)
+
+            # Extract model info if available
+            props = dict(_DEVICE_PROP.findall(match['props']))
+            devices.append({
+                'serial': match['serial'],
+                'status': match['status'],
+                'model': props.get('model', "Unknown"),
+                'product': props.get('product', "Unknown")
+            })
+
+        return devices
+
     def verify_storage_access(self, serial: str) -> bool:
         """Check if EldersVR directory exists and is writable"""
         self.logger.info(f"Verifying storage access on device {serial}")
@@ -261,9 +362,7 @@ class ADBManager:
                 if check_result.returncode == 0:
                     self.logger.info(f"✅ Found working fallback path: {test_path}")
                     # Update our paths to use this fallback
-                    self.eldersvr_path = test_path
-                    self.video_path = f"{self.eldersvr_path}/Video"
-                    self.image_path = f"{self.eldersvr_path}/Image"
+                    self._set_device_path(test_path)
                     return True
                 else:
                     self.logger.debug(f"❌ Fallback path not writable: {test_path}")
@@ -433,7 +532,7 @@ class ADBManager:
         if not os.path.exists(local_json_path):
             raise FileNotFoundError(f"Local JSON file not found: {local_json_path}")
 
-        remote_path = f"{self.eldersvr_path}/new_data.json"
+        remote_path = self.json_path
         filename = "new_data.json"
         
         # Check if file already exists on device
@@ -468,7 +567,7 @@ class ADBManager:
             print(f"Warning: credential.json not found at {local_credential_path}")
             return False
 
-        remote_path = f"{self.eldersvr_path}/credential.json"
+        remote_path = self.credential_path
 
         try:
             result = subprocess.run([
@@ -566,7 +665,7 @@ class ADBManager:
         
         try:
             # Check JSON file
-            json_path = f"{self.eldersvr_path}/new_data.json"
+            json_path = self.json_path
             if self.check_file_exists(serial, json_path):
                 size = self.get_file_size(serial, json_path)
                 inventory['json_files']['new_data.json'] = {
@@ -577,7 +676,7 @@ class ADBManager:
                 inventory['total_files'] += 1
             
             # Check credential.json
-            credential_path = f"{self.eldersvr_path}/credential.json"
+            credential_path = self.credential_path
             if self.check_file_exists(serial, credential_path):
                 size = self.get_file_size(serial, credential_path)
                 inventory['json_files']['credential.json'] = {
@@ -701,9 +800,20 @@ class ADBManager:
         
         self.logger.info(f"Starting transfer of {len(file_list)} video files to {serial}")
 
+        if conflict_handler is None:
+            video_files = []
+            for filename in file_list:
+                video_file = os.path.join(local_videos_dir, filename)
+                if os.path.exists(video_file):
+                    video_files.append(video_file)
+                else:
+                    self.logger.warning(f"❌ Video file not found: {video_file}")
+            return self._push_batched(serial, video_files, self.video_path, len(file_list),
+                                      files_to_skip, progress_callback, _VIDEO_BATCH_SIZE)
+
         for idx, filename in enumerate(file_list, 1):
             video_file = os.path.join(local_videos_dir, filename)
-            remote_path = f"{self.video_path}/{filename}"
+            remote_path = self.remote_video_path(filename)
             
             if not os.path.exists(video_file):
                 self.logger.warning(f"❌ Video file not found: {video_file}")
@@ -804,9 +914,13 @@ class ADBManager:
         
         self.logger.info(f"Starting transfer of {len(image_files)} image files to {serial}")
 
+        if conflict_handler is None:
+            return self._push_batched(serial, image_files, self.image_path, len(image_files),
+                                      files_to_skip, progress_callback, _IMAGE_BATCH_SIZE)
+
         for idx, image_file in enumerate(image_files, 1):
             filename = os.path.basename(image_file)
-            remote_path = f"{self.image_path}/{filename}"
+            remote_path = self.remote_image_path(filename)
             local_file_size = os.path.getsize(image_file)
             
             # Skip files that are in the skip list
@@ -884,6 +998,91 @@ class ADBManager:
 
         return success_count, len(image_files)
     
+    def _push_batched(self, serial: str, local_files: List[str], remote_dir: str, total: int,
+                      files_to_skip, progress_callback, batch_size: int) -> Tuple[int, int]:
+        """Push files without per-file conflict prompts as tar batches.
+
+        Used when no conflict_handler is given (the CLI resolves conflicts up
+        front via check_transfer_conflicts). Progress is reported per batch
+        against total, counting skipped files as done.
+        Returns (success_count, total)
+        """
+        to_push = []
+        skipped_count = 0
+        for local_file in local_files:
+            filename = os.path.basename(local_file)
+            if files_to_skip and filename in files_to_skip:
+                self.logger.info(f"⏭️  Skipped {filename} (skip all - already exists on device)")
+                skipped_count += 1
+            else:
+                to_push.append(local_file)
+
+        if progress_callback and skipped_count:
+            progress_callback(skipped_count, total, 100)
+
+        def batch_progress(success_count, _batch_total, file_progress):
+            if progress_callback:
+                progress_callback(skipped_count + success_count, total, file_progress)
+
+        success_count, _ = self.push_batch(serial, to_push, remote_dir, batch_size, batch_progress)
+        return success_count, total
+
+    @CLIAccessControl.require_cli_access("transfer")
+    def push_batch(self, serial: str, local_files: List[str], remote_dir: str, batch_size: int = 70,
+                   progress_callback=None) -> Tuple[int, int]:
+        """Push files into a device directory as streamed tar batches.
+
+        Each batch of up to batch_size files is sent through a single
+        `adb exec-in` process that extracts a tar stream on the device,
+        instead of spawning one `adb push` per file.
+
+        Returns (success_count, total_count)
+        """
+        total = len(local_files)
+        success_count = 0
+        quoted_dir = shlex.quote(remote_dir)
+        extract_cmd = f"mkdir -p {quoted_dir} && cd {quoted_dir} && tar -xf -"
+
+        self.logger.info(f"Starting batched transfer of {total} files to {serial}:{remote_dir}")
+
+        for start in range(0, total, batch_size):
+            batch = local_files[start:start + batch_size]
+            self.logger.debug(f"Streaming batch of {len(batch)} files ({start + 1}-{start + len(batch)}/{total})")
+
+            process = None
+            try:
+                process = subprocess.Popen([
+                    "adb", "-s", serial, "exec-in", extract_cmd
+                ], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+                with tarfile.open(fileobj=process.stdin, mode="w|") as tar:
+                    for local_file in batch:
+                        tar.add(local_file, arcname=os.path.basename(local_file))
+
+                _, stderr = process.communicate(timeout=300)
+
+                if process.returncode == 0:
+                    success_count += len(batch)
+                    self.logger.debug(f"✅ Batch of {len(batch)} files transferred")
+                else:
+                    error = stderr.decode('utf-8', errors='replace').strip()
+                    self.logger.warning(f"❌ Batch transfer failed: {error}")
+
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                self.logger.error(f"❌ Timeout streaming batch to device {serial}")
+            except (OSError, tarfile.TarError) as e:
+                if process:
+                    process.kill()
+                    process.communicate()
+                self.logger.error(f"❌ Error streaming batch to device {serial}: {e}")
+
+            if progress_callback:
+                progress_callback(success_count, total, 100)
+
+        return success_count, total
+
     def _format_file_size(self, bytes_size: int) -> str:
         """Format file size in human readable format"""
         for unit in ['B', 'KB', 'MB', 'GB']:
@@ -939,7 +1138,7 @@ class ADBManager:
             # Check JSON file
             json_check = subprocess.run([
                 "adb", "-s", serial, "shell",
-                "test", "-f", f"{self.eldersvr_path}/new_data.json"
+                "test", "-f", self.json_path
             ], capture_output=True, timeout=10)
             verification['json_exists'] = json_check.returncode == 0
 
@@ -4,6 +4,7 @@ Handles authentication, data fetching, and content downloads
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
 import time
@@ -16,6 +17,29 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
 from ..utils import DownloadProgressTable
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is used otherwise
+    orjson = None
+
+# Keys required in new_data.json, in the order missing ones are reported.
+# The frozensets give a single subset check for the common all-present case.
+_REQUIRED_DATA_KEYS = ("lastModified", "videos", "tags")
+_VIDEO_KEY_ORDER = (
+    "id", "title", "description", "thumbnailKey", "thumbnailUrl",
+    "fileKeyLow", "fileKey", "fileUrlLow", "fileUrl", "isActive", "tags"
+)
+_TAG_KEY_ORDER = ("id", "name")
+_REQUIRED_VIDEO_KEYS = frozenset(_VIDEO_KEY_ORDER)
+_REQUIRED_TAG_KEYS = frozenset(_TAG_KEY_ORDER)
+
+# Item rules for new_data.json collections:
+# (collection key, issue label, required keys, report order)
+_NEW_DATA_SCHEMA = (
+    ("videos", "Video", _REQUIRED_VIDEO_KEYS, _VIDEO_KEY_ORDER),
+    ("tags", "Tag", _REQUIRED_TAG_KEYS, _TAG_KEY_ORDER),
+)
+
 
 class ContentManager:
     """Manages content operations with EldersVR backend API"""
@@ -36,6 +60,14 @@ class ContentManager:
         self.retry_attempts = self.download_config.get('retry_attempts', 3)
         self.retry_delay = self.download_config.get('retry_delay', 1.0)
 
+        # Asset downloads get their own session so they never carry the API's
+        # Authorization header to the storage host, with one keep-alive
+        # connection per download worker instead of a handshake per file
+        self._download_session = requests.Session()
+        download_adapter = HTTPAdapter(pool_maxsize=self.max_concurrent_downloads)
+        self._download_session.mount('https://', download_adapter)
+        self._download_session.mount('http://', download_adapter)
+
         # Progress tracking
         self._download_stats_lock = Lock()
         self._current_downloads = 0
@@ -73,7 +105,7 @@ class ContentManager:
             auth_data["email"] = email
 
         try:
-            response = self.session.post(auth_endpoint, json=auth_data, timeout=30)
+            response = self._upload_json(auth_endpoint, auth_data, timeout=30)
             response.raise_for_status()
 
             result = response.json()
@@ -101,6 +133,15 @@ class ContentManager:
             print(f"Authentication failed: {e}")
             return False
 
+    def _upload_json(self, endpoint: str, obj: Any, timeout: int = 30) -> requests.Response:
+        """POST a JSON body encoded once (with orjson when available) as bytes"""
+        if orjson is not None:
+            body = orjson.dumps(obj)
+        else:
+            body = json.dumps(obj, ensure_ascii=False).encode('utf-8')
+        return self.session.post(endpoint, data=body, timeout=timeout,
+                                 headers={'Content-Type': 'application/json'})
+
     def is_authenticated(self) -> bool:
         """Check if currently authenticated (token exists locally)"""
         return self.auth_token is not None
@@ -200,10 +241,8 @@ class ContentManager:
             raise ValueError("Films data and tags data are required")
 
         # Transform films API response to mobile app format
-        videos = []
-
-        for film in films_data.get("films", []):
-            video = {
+        videos = [
+            {
                 "id": str(film["id"]),
                 "title": film["title"],
                 "description": film["description"],
@@ -216,7 +255,8 @@ class ContentManager:
                 "isActive": film["isActive"],
                 "tags": film.get("tags", [])
             }
-            videos.append(video)
+            for film in films_data.get("films", [])
+        ]
 
         # Generate final new_data.json structure
         new_data = {
@@ -229,10 +269,14 @@ class ContentManager:
         downloads_dir = self.config['paths']['local_downloads']
         os.makedirs(downloads_dir, exist_ok=True)
 
-        # Save to local file
+        # Save to local file - serialize up front so the file is written in one call
+        # instead of json.dump's many small chunk writes
         json_file_path = f"{downloads_dir}/new_data.json"
-        with open(json_file_path, "w", encoding='utf-8') as f:
-            json.dump(new_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            Path(json_file_path).write_bytes(orjson.dumps(new_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_file_path, "w", encoding='utf-8') as f:
+                f.write(json.dumps(new_data, indent=2, ensure_ascii=False))
 
         return new_data
 
@@ -253,7 +297,7 @@ class ContentManager:
                     local_path = os.path.join(local_path, filename)
 
                 # Download with progress indication for large files
-                response = requests.get(url, stream=True, timeout=self.timeout)
+                response = self._download_session.get(url, stream=True, timeout=self.timeout)
                 response.raise_for_status()
 
                 total_size = int(response.headers.get('content-length', 0))
@@ -612,39 +656,17 @@ class ContentManager:
         issues = []
 
         # Check required top-level keys
-        required_keys = ["lastModified", "videos", "tags"]
-        for key in required_keys:
+        for key in _REQUIRED_DATA_KEYS:
             if key not in data:
                 issues.append(f"Missing required key: {key}")
 
-        # Validate videos structure
-        if "videos" in data:
-            for i, video in enumerate(data["videos"]):
-                video_issues = []
-                required_video_keys = [
-                    "id", "title", "description", "thumbnailKey", "thumbnailUrl",
-                    "fileKeyLow", "fileKey", "fileUrlLow", "fileUrl", "isActive", "tags"
-                ]
-
-                for key in required_video_keys:
-                    if key not in video:
-                        video_issues.append(f"Missing key: {key}")
-
-                if video_issues:
-                    issues.append(f"Video {i}: {', '.join(video_issues)}")
-
-        # Validate tags structure
-        if "tags" in data:
-            for i, tag in enumerate(data["tags"]):
-                tag_issues = []
-                required_tag_keys = ["id", "name"]
-
-                for key in required_tag_keys:
-                    if key not in tag:
-                        tag_issues.append(f"Missing key: {key}")
-
-                if tag_issues:
-                    issues.append(f"Tag {i}: {', '.join(tag_issues)}")
+        # Validate videos and tags structure
+        for collection, label, required_keys, key_order in _NEW_DATA_SCHEMA:
+            for i, item in enumerate(data.get(collection, ())):
+                if required_keys <= item.keys():
+                    continue
+                item_issues = [f"Missing key: {key}" for key in key_order if key not in item]
+                issues.append(f"{label} {i}: {', '.join(item_issues)}")
 
         return issues
 
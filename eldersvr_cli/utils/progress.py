@@ -2,13 +2,59 @@
 Progress display utilities for EldersVR CLI
 """
 
+import io
 import sys
 import time
 import os
-from typing import Optional, Dict, Any, List
+from array import array
+from typing import Optional, Dict, Any, List, Tuple
 from threading import Lock
 
 
+# Bar segments are sliced from these instead of being rebuilt on every refresh
+_BAR_CACHE_WIDTH = 50
+_FULL_BAR = "█" * _BAR_CACHE_WIDTH
+_EMPTY_BAR = "░" * _BAR_CACHE_WIDTH
+
+# ANSI sequences used to repaint frames in place
+_CLEAR_SCREEN = "\033[2J"
+_CURSOR_HOME = "\033[H"
+_ERASE_LINE = "\033[K"
+_ERASE_BELOW = "\033[J"
+# Synchronized output (mode 2026): terminals that support it present the
+# whole frame at once; others ignore the sequences
+_BEGIN_SYNC = "\033[?2026h"
+_END_SYNC = "\033[?2026l"
+
+# Transfer states that must always be painted, regardless of throttling
+_TERMINAL_STATUSES = ('completed', 'failed')
+
+# Download table row layout, shared by the header and every file row
+_ROW_FMT = "{name:<35} {type:<12} {status:<12} {progress:<12} {size:<12} {speed:<12}"
+_TABLE_HEADER = _ROW_FMT.format(
+    name='File Name', type='Type', status='Status', progress='Progress', size='Size', speed='Speed'
+)
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+def _scale_bytes(value: float) -> Tuple[float, str]:
+    """Scale a byte count to its 1024-based unit using the integer bit length"""
+    if value < 1024:
+        return value, _SIZE_UNITS[0]
+    index = min((int(value).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return value / (1 << (index * 10)), _SIZE_UNITS[index]
+
+
+def _bar(filled: int, width: int) -> str:
+    """Build a filled/empty bar of the given width"""
+    filled = min(max(filled, 0), width)
+    if width <= _BAR_CACHE_WIDTH:
+        return _FULL_BAR[:filled] + _EMPTY_BAR[:width - filled]
+    return "█" * filled + "░" * (width - filled)
+
+
 class ProgressBar:
     """Simple progress bar for command line operations"""
     
@@ -17,7 +63,7 @@ class ProgressBar:
         self.current = 0
         self.description = description
         self.width = width
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.last_update = 0
     
     def update(self, amount: int = 1):
@@ -40,10 +86,10 @@ class ProgressBar:
         filled_width = int(self.width * progress)
         
         # Create progress bar
-        bar = "█" * filled_width + "░" * (self.width - filled_width)
+        bar = _bar(filled_width, self.width)
         
         # Calculate elapsed time and ETA
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         if progress > 0 and self.current < self.total:
             eta = elapsed / progress * (1 - progress)
             eta_str = f" ETA: {self._format_time(eta)}"
@@ -79,158 +125,289 @@ class ProgressBar:
         self._display()
 
 
-class TransferProgress:
-    """Progress tracker for device transfers with real-time text percentages"""
+class _LiveFrame:
+    """Repaints a multi-line frame in place instead of clearing the screen"""
+    
+    _frame_lines = 0
+    _last_lines = 0  # Lines painted by the previous frame
+    
+    def _begin_frame(self):
+        """Start a new frame at the cursor home, clearing the screen only for the first frame"""
+        self._frame = io.StringIO()
+        self._frame.write(_BEGIN_SYNC)
+        self._frame.write(_CURSOR_HOME if self._last_lines else _CLEAR_SCREEN + _CURSOR_HOME)
+        self._frame_lines = 0
+    
+    def _line(self, text: str = ""):
+        """Add a line that overwrites the current terminal line"""
+        self._frame.write(f"{text}{_ERASE_LINE}\n")
+        self._frame_lines += 1
+    
+    def _end_frame(self):
+        """Erase leftovers from a taller previous frame and emit the whole frame"""
+        if self._frame_lines < self._last_lines:
+            self._frame.write(_ERASE_BELOW)
+        self._frame.write(_END_SYNC)
+        self._last_lines = self._frame_lines
+        self._emit(self._frame.getvalue())
+    
+    def _emit(self, frame: str):
+        """Write a frame straight to the stdout file descriptor in one go"""
+        try:
+            # Only on POSIX: the Windows console needs sys.stdout's text
+            # writer to render emoji and bar characters correctly
+            fd = sys.stdout.fileno() if os.name == 'posix' else None
+        except (AttributeError, OSError, ValueError):
+            # No real descriptor (e.g. captured or redirected stdout)
+            fd = None
+        if fd is None:
+            sys.stdout.write(frame)
+            sys.stdout.flush()
+            return
+        
+        # Anything already buffered by print() must land before the frame
+        sys.stdout.flush()
+        data = frame.encode(sys.stdout.encoding or 'utf-8', errors='replace')
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+
+
+class _FileColumns:
+    """Per-device transfer state for one file category, stored column-wise"""
+    
+    __slots__ = ('status', 'current', 'total', 'start_time')
     
     def __init__(self):
-        self.devices: Dict[str, Dict[str, Any]] = {}
-        self.last_update_time = 0
-        self.update_interval = 0.1  # Update every 100ms for real-time feel
+        self.status: List[str] = []
+        self.current = array('I')
+        self.total = array('I')
+        self.start_time: List[Optional[float]] = []
+    
+    def append(self):
+        self.status.append('pending')
+        self.current.append(0)
+        self.total.append(0)
+        self.start_time.append(None)
+    
+    def update(self, i: int, current: int, total: int, status: str, now: float):
+        self.current[i] = current
+        self.total[i] = total
+        self.status[i] = status
+        if status == 'in_progress' and self.start_time[i] is None:
+            self.start_time[i] = now
+
+
+class TransferProgress(_LiveFrame):
+    """Progress tracker for device transfers with real-time text percentages"""
     
-    def add_device(self, serial: str, name: str = ""):
-        """Add a device to track"""
-        self.devices[serial] = {
-            'name': name or serial,
-            'json': {'status': 'pending', 'size': 0, 'start_time': None},
-            'videos': {'status': 'pending', 'current': 0, 'total': 0, 'size': 0, 'start_time': None},
-            'images': {'status': 'pending', 'current': 0, 'total': 0, 'size': 0, 'start_time': None}
-        }
+    def __init__(self, max_display_devices: int = 4, clock=time.monotonic):
+        # Device state is kept column-wise: row i of every column is the
+        # device at self._serials[i], found by serial through self._index
+        self._index: Dict[str, int] = {}
+        self._serials: List[str] = []
+        self._names: List[str] = []
+        self._sections: List[Tuple[Tuple[str, str], ...]] = []
+        self._json_status: List[str] = []
+        self._json_size = array('Q')
+        self._json_start: List[Optional[float]] = []
+        self._files = {'videos': _FileColumns(), 'images': _FileColumns()}
+        # Time source for throttling and elapsed times; injectable for tests
+        self._clock = clock
+        self.last_update_time = float('-inf')  # First frame is never throttled
+        self.update_interval = 0.1  # Update every 100ms for real-time feel
+        # Above this many devices only actively transferring ones get full detail
+        self.max_display_devices = max_display_devices
+        self._active_serials: set = set()
+        self._completed_serials: set = set()
+        self._failed_serials: set = set()
+    
+    def add_device(self, serial: str, name: str = "", has_videos: bool = True, has_images: bool = True):
+        """Add a device to track, showing only the file rows it will receive"""
+        sections = []
+        if has_videos:
+            sections.append(('Video Files', 'videos'))
+        if has_images:
+            sections.append(('Image Files', 'images'))
+        
+        if serial in self._index:
+            # Re-adding a device resets its row in place
+            i = self._index[serial]
+            self._names[i] = name or serial
+            self._sections[i] = tuple(sections)
+            self._json_status[i] = 'pending'
+            self._json_size[i] = 0
+            self._json_start[i] = None
+            for columns in self._files.values():
+                columns.status[i] = 'pending'
+                columns.current[i] = 0
+                columns.total[i] = 0
+                columns.start_time[i] = None
+        else:
+            self._index[serial] = len(self._serials)
+            self._serials.append(serial)
+            self._names.append(name or serial)
+            self._sections.append(tuple(sections))
+            self._json_status.append('pending')
+            self._json_size.append(0)
+            self._json_start.append(None)
+            for columns in self._files.values():
+                columns.append()
+        self._refresh_device_state(serial)
+    
+    def _refresh_device_state(self, serial: str):
+        """Recompute which of the active/completed/failed sets a device belongs to"""
+        i = self._index[serial]
+        statuses = (self._json_status[i], self._files['videos'].status[i], self._files['images'].status[i])
+        
+        if 'in_progress' in statuses:
+            self._active_serials.add(serial)
+        else:
+            self._active_serials.discard(serial)
+        
+        if 'failed' in statuses:
+            self._failed_serials.add(serial)
+        else:
+            self._failed_serials.discard(serial)
+        
+        # Same definition as get_summary: pending videos/images means not applicable
+        if statuses[0] == 'completed' and statuses[1] in ('completed', 'pending') and statuses[2] in ('completed', 'pending'):
+            self._completed_serials.add(serial)
+        else:
+            self._completed_serials.discard(serial)
     
     def update_json_status(self, serial: str, status: str, size: int = 0):
         """Update JSON transfer status"""
-        if serial in self.devices:
-            self.devices[serial]['json']['status'] = status
-            self.devices[serial]['json']['size'] = size
-            if status == 'in_progress' and self.devices[serial]['json']['start_time'] is None:
-                self.devices[serial]['json']['start_time'] = time.time()
-            self._display_progress_realtime()
+        i = self._index.get(serial)
+        if i is not None:
+            self._json_status[i] = status
+            self._json_size[i] = size
+            if status == 'in_progress' and self._json_start[i] is None:
+                self._json_start[i] = self._clock()
+            self._refresh_device_state(serial)
+            self._display_progress_realtime(force=status in _TERMINAL_STATUSES)
     
     def update_videos_progress(self, serial: str, current: int, total: int, status: str = 'in_progress'):
         """Update video transfer progress"""
-        if serial in self.devices:
-            self.devices[serial]['videos'].update({
-                'current': current,
-                'total': total,
-                'status': status
-            })
-            if status == 'in_progress' and self.devices[serial]['videos']['start_time'] is None:
-                self.devices[serial]['videos']['start_time'] = time.time()
-            self._display_progress_realtime()
+        self._update_file_progress('videos', serial, current, total, status)
     
     def update_images_progress(self, serial: str, current: int, total: int, status: str = 'in_progress'):
         """Update image transfer progress"""
-        if serial in self.devices:
-            self.devices[serial]['images'].update({
-                'current': current,
-                'total': total,
-                'status': status
-            })
-            if status == 'in_progress' and self.devices[serial]['images']['start_time'] is None:
-                self.devices[serial]['images']['start_time'] = time.time()
-            self._display_progress_realtime()
-    
-    def _display_progress_realtime(self):
-        """Display transfer progress with real-time text percentages"""
-        current_time = time.time()
+        self._update_file_progress('images', serial, current, total, status)
+    
+    def _update_file_progress(self, key: str, serial: str, current: int, total: int, status: str):
+        """Update progress for one file category of a device"""
+        i = self._index.get(serial)
+        if i is not None:
+            self._files[key].update(i, current, total, status, self._clock())
+            self._refresh_device_state(serial)
+            self._display_progress_realtime(force=status in _TERMINAL_STATUSES)
+    
+    def _display_progress_realtime(self, force: bool = False):
+        """Display transfer progress with real-time text percentages.
+
+        Redraws are capped at one per update_interval; force bypasses the cap
+        so terminal state transitions are always painted.
+        """
+        current_time = self._clock()
         
         # Throttle updates to avoid excessive flickering
-        if current_time - self.last_update_time < self.update_interval:
+        if not force and current_time - self.last_update_time < self.update_interval:
             return
         self.last_update_time = current_time
         
-        # Clear screen and move cursor to top
-        print("\033[2J\033[H", end="")
+        self._begin_frame()
         
-        print("=" * 60)
-        print("ELDERSVR CONTENT DEPLOYMENT - REAL-TIME PROGRESS")
-        print("=" * 60)
-        print()
+        self._line("=" * 60)
+        self._line("ELDERSVR CONTENT DEPLOYMENT - REAL-TIME PROGRESS")
+        self._line("=" * 60)
+        self._line()
         
-        for serial, device in self.devices.items():
-            print(f"[{device['name']} - {serial}]")
-            print("-" * 40)
-            
-            # JSON transfer
-            json_info = device['json']
-            json_status = self._get_status_text(json_info['status'])
-            if json_info['status'] == 'in_progress':
-                elapsed = time.time() - json_info['start_time'] if json_info['start_time'] else 0
-                print(f"  JSON File:     {json_status} [{elapsed:.1f}s]")
-            else:
-                size_str = self._format_size(json_info['size']) if json_info['size'] > 0 else ""
-                print(f"  JSON File:     {json_status} {size_str}")
-            
-            # Videos transfer
-            videos = device['videos']
-            if videos['total'] > 0:
-                percent = (videos['current'] / videos['total']) * 100
-                elapsed = time.time() - videos['start_time'] if videos['start_time'] else 0
-                remaining = videos['total'] - videos['current']
-                
-                if videos['status'] == 'in_progress':
-                    # Calculate transfer speed
-                    if elapsed > 0 and videos['current'] > 0:
-                        speed = videos['current'] / elapsed
-                        eta = remaining / speed if speed > 0 else 0
-                        print(f"  Video Files:   {percent:6.2f}% ({videos['current']:3d}/{videos['total']:3d}) | Elapsed: {elapsed:.1f}s | ETA: {eta:.1f}s")
-                    else:
-                        print(f"  Video Files:   {percent:6.2f}% ({videos['current']:3d}/{videos['total']:3d}) | Starting...")
-                else:
-                    status_text = self._get_status_text(videos['status'])
-                    print(f"  Video Files:   {status_text} ({videos['current']}/{videos['total']})")
-            else:
-                print(f"  Video Files:   {self._get_status_text(videos['status'])}")
-            
-            # Images transfer
-            images = device['images']
-            if images['total'] > 0:
-                percent = (images['current'] / images['total']) * 100
-                elapsed = time.time() - images['start_time'] if images['start_time'] else 0
-                remaining = images['total'] - images['current']
-                
-                if images['status'] == 'in_progress':
-                    # Calculate transfer speed
-                    if elapsed > 0 and images['current'] > 0:
-                        speed = images['current'] / elapsed
-                        eta = remaining / speed if speed > 0 else 0
-                        print(f"  Image Files:   {percent:6.2f}% ({images['current']:3d}/{images['total']:3d}) | Elapsed: {elapsed:.1f}s | ETA: {eta:.1f}s")
-                    else:
-                        print(f"  Image Files:   {percent:6.2f}% ({images['current']:3d}/{images['total']:3d}) | Starting...")
-                else:
-                    status_text = self._get_status_text(images['status'])
-                    print(f"  Image Files:   {status_text} ({images['current']}/{images['total']})")
-            else:
-                print(f"  Image Files:   {self._get_status_text(images['status'])}")
+        device_count = len(self._serials)
+        if device_count <= self.max_display_devices:
+            for i in range(device_count):
+                self._display_device(i)
+        else:
+            # Large fleets: detail only the devices doing work, condense the rest
+            for serial in sorted(self._active_serials):
+                self._display_device(self._index[serial])
             
-            print()  # Blank line between devices
+            inactive = device_count - len(self._active_serials)
+            if inactive > 0:
+                self._line(f"{len(self._completed_serials)}/{device_count} devices complete | "
+                           f"{len(self._failed_serials)} failed | {inactive} not transferring")
+                self._line()
         
         # Show overall progress
         self._display_overall_progress()
+        self._end_frame()
+    
+    def _display_device(self, i: int):
+        """Display transfer progress for the device at row i"""
+        self._line(f"[{self._names[i]} - {self._serials[i]}]")
+        self._line("-" * 40)
+        
+        # JSON transfer
+        json_status = self._json_status[i]
+        json_text = self._get_status_text(json_status)
+        if json_status == 'in_progress':
+            start_time = self._json_start[i]
+            elapsed = self._clock() - start_time if start_time is not None else 0
+            self._line(f"  JSON File:     {json_text} [{elapsed:.1f}s]")
+        else:
+            size = self._json_size[i]
+            size_str = self._format_size(size) if size > 0 else ""
+            self._line(f"  JSON File:     {json_text} {size_str}")
+        
+        # File transfers, limited to the categories this device uses
+        for label, key in self._sections[i]:
+            self._display_file_category(label, self._files[key], i)
+        
+        self._line()  # Blank line between devices
+    
+    def _display_file_category(self, label: str, columns: _FileColumns, i: int):
+        """Display progress for one file category (videos or images) of a device"""
+        status = columns.status[i]
+        current = columns.current[i]
+        total = columns.total[i]
+        if total > 0:
+            percent = (current / total) * 100
+            start_time = columns.start_time[i]
+            elapsed = self._clock() - start_time if start_time is not None else 0
+            remaining = total - current
+            
+            if status == 'in_progress':
+                # Calculate transfer speed
+                if elapsed > 0 and current > 0:
+                    speed = current / elapsed
+                    eta = remaining / speed if speed > 0 else 0
+                    self._line(f"  {label}:   {percent:6.2f}% ({current:3d}/{total:3d}) | Elapsed: {elapsed:.1f}s | ETA: {eta:.1f}s")
+                else:
+                    self._line(f"  {label}:   {percent:6.2f}% ({current:3d}/{total:3d}) | Starting...")
+            else:
+                status_text = self._get_status_text(status)
+                self._line(f"  {label}:   {status_text} ({current}/{total})")
+        else:
+            self._line(f"  {label}:   {self._get_status_text(status)}")
+    
+    def _file_totals(self) -> Tuple[int, int]:
+        """Total and completed file counts across all devices (JSON included)"""
+        videos = self._files['videos']
+        images = self._files['images']
+        total_files = len(self._serials) + sum(videos.total) + sum(images.total)
+        completed_files = (self._json_status.count('completed')
+                           + sum(videos.current) + sum(images.current))
+        return total_files, completed_files
     
     def _display_overall_progress(self):
         """Display overall transfer progress"""
-        total_files = 0
-        completed_files = 0
-        
-        for device in self.devices.values():
-            # Count JSON file
-            total_files += 1
-            if device['json']['status'] == 'completed':
-                completed_files += 1
-            
-            # Count videos
-            total_files += device['videos']['total']
-            completed_files += device['videos']['current']
-            
-            # Count images
-            total_files += device['images']['total']
-            completed_files += device['images']['current']
+        total_files, completed_files = self._file_totals()
         
         if total_files > 0:
             overall_percent = (completed_files / total_files) * 100
-            print("=" * 60)
-            print(f"OVERALL PROGRESS: {overall_percent:6.2f}% ({completed_files}/{total_files} files)")
-            print("=" * 60)
+            self._line("=" * 60)
+            self._line(f"OVERALL PROGRESS: {overall_percent:6.2f}% ({completed_files}/{total_files} files)")
+            self._line("=" * 60)
     
     def _get_status_text(self, status: str) -> str:
         """Get text representation of status"""
@@ -259,77 +436,55 @@ class TransferProgress:
     def _create_mini_bar(self, current: int, total: int, width: int = 12) -> str:
         """Create a mini progress bar"""
         if total == 0:
-            return "░" * width
+            return _bar(0, width)
         
         progress = current / total
         filled = int(width * progress)
-        return "█" * filled + "░" * (width - filled)
+        return _bar(filled, width)
     
     def _format_size(self, bytes_size: int) -> str:
         """Format file size in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes_size < 1024:
-                return f"({bytes_size:.1f}{unit})"
-            bytes_size /= 1024
-        return f"({bytes_size:.1f}TB)"
+        value, unit = _scale_bytes(bytes_size)
+        return f"({value:.1f}{unit})"
     
     def get_summary(self) -> Dict[str, int]:
         """Get transfer summary"""
-        summary = {
-            'total_devices': len(self.devices),
-            'completed_devices': 0,
-            'failed_transfers': 0,
-            'total_files': 0,
-            'completed_files': 0
+        total_files, completed_files = self._file_totals()
+        return {
+            'total_devices': len(self._serials),
+            'completed_devices': len(self._completed_serials),
+            'failed_transfers': len(self._failed_serials),
+            'total_files': total_files,
+            'completed_files': completed_files
         }
-        
-        for device in self.devices.values():
-            # Count completed devices
-            all_completed = (
-                device['json']['status'] == 'completed' and
-                device['videos']['status'] in ['completed', 'pending'] and  # pending means not applicable (master)
-                device['images']['status'] in ['completed', 'pending']
-            )
-            
-            if all_completed:
-                summary['completed_devices'] += 1
-            
-            # Count failed transfers
-            if (device['json']['status'] == 'failed' or 
-                device['videos']['status'] == 'failed' or 
-                device['images']['status'] == 'failed'):
-                summary['failed_transfers'] += 1
-            
-            # Count files
-            summary['total_files'] += 1  # JSON file
-            summary['total_files'] += device['videos']['total']
-            summary['total_files'] += device['images']['total']
-            
-            # Count completed files
-            if device['json']['status'] == 'completed':
-                summary['completed_files'] += 1
-            summary['completed_files'] += device['videos']['current']
-            summary['completed_files'] += device['images']['current']
-        
-        return summary
 
 
-class DownloadProgressTable:
+class DownloadProgressTable(_LiveFrame):
     """Table-based progress display for parallel downloads"""
     
     def __init__(self, max_display_files: int = 20):
         self.downloads: Dict[str, Dict[str, Any]] = {}
         self.lock = Lock()
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.last_update = 0
         self.update_interval = 0.2  # Update every 200ms
         self.max_display_files = max_display_files
         self.completed_count = 0
         self.total_count = 0
+        self._dirty = False  # Set when state changed since the last rendered frame
+        # Maintained incrementally under self.lock so summaries don't rescan downloads
+        self._status_counts: Dict[str, int] = {
+            'pending': 0, 'downloading': 0, 'completed': 0, 'failed': 0
+        }
+        self._total_downloaded = 0
         
     def add_download(self, filename: str, file_type: str, url: str = ""):
         """Add a new download to track"""
         with self.lock:
+            previous = self.downloads.get(filename)
+            if previous is not None:
+                self._status_counts[previous['status']] = self._status_counts.get(previous['status'], 0) - 1
+                self._total_downloaded -= previous['size_downloaded']
             self.downloads[filename] = {
                 'type': file_type,
                 'url': url,
@@ -340,15 +495,32 @@ class DownloadProgressTable:
                 'speed': 0.0,
                 'start_time': None,
                 'end_time': None,
-                'error': None
+                'error': None,
+                'last_reported': 0
             }
             self.total_count += 1
+            self._status_counts['pending'] += 1
+            self._dirty = True
     
     def update_download(self, filename: str, downloaded: int, total: int, status: str = 'downloading'):
         """Update download progress"""
+        # Coalesce high-rate chunk callbacks: small forward progress deltas on an
+        # already running download return without taking the lock. Status/size
+        # changes, terminal states, counts that go backward (a retried download
+        # restarting at 0) and unknown-length downloads, whose final byte count
+        # mark_completed cannot fill in from total_size, always go through.
+        download = self.downloads.get(filename)
+        if (download is not None and status == 'downloading'
+                and download['status'] == 'downloading'
+                and total > 0 and download['total_size'] == total
+                and 0 <= downloaded - download['last_reported'] < max(total / 1000, 65536)):
+            return
+        
         with self.lock:
             if filename in self.downloads:
                 download = self.downloads[filename]
+                old_status, old_size = download['status'], download['size_downloaded']
+                download['last_reported'] = downloaded
                 download['size_downloaded'] = downloaded
                 download['total_size'] = total
                 download['status'] = status
@@ -356,22 +528,24 @@ class DownloadProgressTable:
                 
                 # Calculate speed
                 if download['start_time'] is None and status == 'downloading':
-                    download['start_time'] = time.time()
+                    download['start_time'] = time.monotonic()
                 
                 if download['start_time'] and downloaded > 0:
-                    elapsed = time.time() - download['start_time']
+                    elapsed = time.monotonic() - download['start_time']
                     if elapsed > 0:
                         download['speed'] = downloaded / elapsed
                 
                 # Mark completion
                 if status in ['completed', 'failed']:
-                    download['end_time'] = time.time()
+                    download['end_time'] = time.monotonic()
                     if status == 'completed' and downloaded == 0:
                         # For completed downloads, ensure we show 100%
                         download['progress'] = 100.0
                         if total > 0:
                             download['size_downloaded'] = total
                 
+                self._update_counters(download, old_status, old_size)
+                self._dirty = True
                 self._update_display()
     
     def mark_completed(self, filename: str, success: bool = True, error: str = None):
@@ -379,6 +553,7 @@ class DownloadProgressTable:
         with self.lock:
             if filename in self.downloads:
                 download = self.downloads[filename]
+                old_status, old_size = download['status'], download['size_downloaded']
                 if success:
                     download['status'] = 'completed'
                     download['progress'] = 100.0
@@ -389,12 +564,25 @@ class DownloadProgressTable:
                     download['status'] = 'failed'
                     download['error'] = error
                 
-                download['end_time'] = time.time()
+                download['end_time'] = time.monotonic()
+                self._update_counters(download, old_status, old_size)
+                self._dirty = True
                 self._update_display()
     
+    def _update_counters(self, download: Dict[str, Any], old_status: str, old_size: int):
+        """Apply a download's status/size change to the running counters (caller holds lock)"""
+        if download['status'] != old_status:
+            self._status_counts[old_status] = self._status_counts.get(old_status, 0) - 1
+            self._status_counts[download['status']] = self._status_counts.get(download['status'], 0) + 1
+        self._total_downloaded += download['size_downloaded'] - old_size
+    
     def _update_display(self):
         """Update the progress table display"""
-        current_time = time.time()
+        # Nothing changed since the last frame
+        if not self._dirty:
+            return
+        
+        current_time = time.monotonic()
         
         # Throttle updates
         if current_time - self.last_update < self.update_interval:
@@ -402,33 +590,32 @@ class DownloadProgressTable:
         self.last_update = current_time
         
         self._render_table()
+        self._dirty = False
     
     def _render_table(self):
         """Render the progress table"""
-        # Clear screen and move to top
-        os.system('clear' if os.name == 'posix' else 'cls')
+        self._begin_frame()
         
-        print("=" * 120)
-        print("ELDERSVR PARALLEL DOWNLOAD PROGRESS")
-        print("=" * 120)
+        self._line("=" * 120)
+        self._line("ELDERSVR PARALLEL DOWNLOAD PROGRESS")
+        self._line("=" * 120)
         
         # Overall stats
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         overall_progress = (self.completed_count / self.total_count * 100) if self.total_count > 0 else 0
         
         # Count by status
-        pending = sum(1 for d in self.downloads.values() if d['status'] == 'pending')
-        downloading = sum(1 for d in self.downloads.values() if d['status'] == 'downloading')
-        completed = sum(1 for d in self.downloads.values() if d['status'] == 'completed')
-        failed = sum(1 for d in self.downloads.values() if d['status'] == 'failed')
+        pending = self._status_counts['pending']
+        downloading = self._status_counts['downloading']
+        completed = self._status_counts['completed']
+        failed = self._status_counts['failed']
         
-        print(f"Overall: {overall_progress:6.2f}% | Elapsed: {elapsed:6.1f}s | Total: {self.total_count} | ⏳{pending} 🔄{downloading} ✅{completed} ❌{failed}")
-        print()
+        self._line(f"Overall: {overall_progress:6.2f}% | Elapsed: {elapsed:6.1f}s | Total: {self.total_count} | ⏳{pending} 🔄{downloading} ✅{completed} ❌{failed}")
+        self._line()
         
         # Table header
-        header = f"{'File Name':<35} {'Type':<12} {'Status':<12} {'Progress':<12} {'Size':<12} {'Speed':<12}"
-        print(header)
-        print("-" * 120)
+        self._line(_TABLE_HEADER)
+        self._line("-" * 120)
         
         # Sort downloads: downloading first, then pending, then completed/failed
         sorted_downloads = sorted(
@@ -451,9 +638,9 @@ class DownloadProgressTable:
                 remaining = len(self.downloads) - displayed
                 active_remaining = sum(1 for fn, d in sorted_downloads[displayed:] if d['status'] in ['downloading', 'pending'])
                 if active_remaining > 0:
-                    print(f"... and {active_remaining} more active + {remaining - active_remaining} completed files")
+                    self._line(f"... and {active_remaining} more active + {remaining - active_remaining} completed files")
                 else:
-                    print(f"... and {remaining} more completed files")
+                    self._line(f"... and {remaining} more completed files")
                 break
             
             # Truncate long filenames
@@ -502,23 +689,30 @@ class DownloadProgressTable:
                 error_preview = download['error'][:40] + "..." if len(download['error']) > 40 else download['error']
                 speed_str = f"Error: {error_preview}"
             
-            print(f"{display_name:<35} {download['type']:<12} {status_display:<12} {progress_str:<12} {size_str:<12} {speed_str:<12}")
+            self._line(_ROW_FMT.format_map({
+                'name': display_name,
+                'type': download['type'],
+                'status': status_display,
+                'progress': progress_str,
+                'size': size_str,
+                'speed': speed_str
+            }))
             displayed += 1
         
-        print("-" * 120)
+        self._line("-" * 120)
         
         # Summary stats
-        total_downloaded = sum(d['size_downloaded'] for d in self.downloads.values())
+        total_downloaded = self._total_downloaded
         total_size = sum(d['total_size'] for d in self.downloads.values() if d['total_size'] > 0)
         
         if total_size > 0:
             overall_size_progress = (total_downloaded / total_size * 100)
-            print(f"Data: {overall_size_progress:5.1f}% | Downloaded: {self._format_size(total_downloaded)} / {self._format_size(total_size)}")
+            self._line(f"Data: {overall_size_progress:5.1f}% | Downloaded: {self._format_size(total_downloaded)} / {self._format_size(total_size)}")
         else:
-            print(f"Data: Downloaded {self._format_size(total_downloaded)}")
+            self._line(f"Data: Downloaded {self._format_size(total_downloaded)}")
         
-        print("=" * 120)
-        sys.stdout.flush()
+        self._line("=" * 120)
+        self._end_frame()
     
     def _get_status_display(self, status: str) -> str:
         """Get display string for status"""
@@ -533,44 +727,35 @@ class DownloadProgressTable:
     def _create_progress_bar(self, progress: float, width: int = 8) -> str:
         """Create a mini progress bar"""
         filled = int((progress / 100) * width)
-        bar = "█" * filled + "░" * (width - filled)
-        return f"[{bar}]"
+        return f"[{_bar(filled, width)}]"
     
     def _format_size(self, bytes_size: int) -> str:
         """Format file size"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes_size < 1024:
-                return f"{bytes_size:6.1f}{unit}"
-            bytes_size /= 1024
-        return f"{bytes_size:6.1f}TB"
+        value, unit = _scale_bytes(bytes_size)
+        return f"{value:6.1f}{unit}"
     
     def _format_speed(self, bytes_per_sec: float) -> str:
         """Format download speed"""
-        for unit in ['B/s', 'KB/s', 'MB/s', 'GB/s']:
-            if bytes_per_sec < 1024:
-                return f"{bytes_per_sec:5.1f}{unit}"
-            bytes_per_sec /= 1024
-        return f"{bytes_per_sec:5.1f}TB/s"
+        value, unit = _scale_bytes(bytes_per_sec)
+        return f"{value:5.1f}{unit}/s"
     
     def get_summary(self) -> Dict[str, Any]:
-        """Get download summary"""
-        with self.lock:
-            completed = sum(1 for d in self.downloads.values() if d['status'] == 'completed')
-            failed = sum(1 for d in self.downloads.values() if d['status'] == 'failed')
-            downloading = sum(1 for d in self.downloads.values() if d['status'] == 'downloading')
-            pending = sum(1 for d in self.downloads.values() if d['status'] == 'pending')
-            
-            total_downloaded = sum(d['size_downloaded'] for d in self.downloads.values())
-            
-            return {
-                'total_files': len(self.downloads),
-                'completed': completed,
-                'failed': failed,
-                'downloading': downloading,
-                'pending': pending,
-                'total_downloaded': total_downloaded,
-                'elapsed_time': time.time() - self.start_time
-            }
+        """Get download summary.
+
+        Reads the running counters without taking self.lock, so producer
+        threads are never blocked by a summary. The snapshot is eventually
+        consistent: counts may straddle an in-flight update.
+        """
+        counts = self._status_counts
+        return {
+            'total_files': len(self.downloads),
+            'completed': counts['completed'],
+            'failed': counts['failed'],
+            'downloading': counts['downloading'],
+            'pending': counts['pending'],
+            'total_downloaded': self._total_downloaded,
+            'elapsed_time': time.monotonic() - self.start_time
+        }
     
     def finish(self):
         """Finish the progress display"""
@@ -3,97 +3,532 @@ Basic tests for EldersVR CLI functionality
 """
 
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, patch, create_autospec, mock_open
+import copy
+from datetime import datetime
+import io
 import json
+import subprocess
 import tempfile
 import os
+from types import MappingProxyType
+
+import pytest
 
 from eldersvr_cli.core import ADBManager, ContentManager
-from eldersvr_cli.config import load_config, get_default_config
+from eldersvr_cli.core import content_manager as content_manager_module
+from eldersvr_cli.config import load_config, get_default_config, get_default_config_mut
+
+# RUN_CONTENT_TESTS=0 skips the ContentManager API tests for a fast ADB/CLI-only run
+RUN_CONTENT_TESTS = os.getenv('RUN_CONTENT_TESTS', '1') == '1'
+
+# tmpfs scratch space for tests that write files; None falls back to the default tempdir
+RAM_TMPDIR = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+# Raw `adb devices -l` output, as bytes the way adb writes it
+ADB_DEVICES_STDOUT = b"\n".join([
+    b"List of devices attached",
+    b"ABC123DEF456\tdevice product:phone model:Samsung_SM_G973F device:beyond1lte",
+    b"XYZ789GHI012\tdevice product:quest model:Meta_Quest_2 device:hollywood",
+    b"",
+])
+
+# Canned subprocess.run results for adb invocations
+ADB_OK_EMPTY = subprocess.CompletedProcess(args=[], returncode=0, stdout=b'', stderr=b'')
+ADB_OK_DEVICES = subprocess.CompletedProcess(args=[], returncode=0, stdout=ADB_DEVICES_STDOUT, stderr=b'')
+
+# Shared read-only fixtures; neither generate_new_data_json nor
+# validate_json_data mutates its input, so tests pass these directly
+
+# Films API response fixture
+FILMS_DATA = MappingProxyType({
+    "films": [
+        {
+            "id": 1,
+            "title": "Test Video",
+            "description": "Test Description",
+            "thumbnailKey": "thumb_1.jpg",
+            "thumbnailUrl": "https://example.com/thumb_1.jpg",
+            "lowQualityFileKey": "lowres_1.mp4",
+            "fileKey": "highres_1.mp4",
+            "lowQualityFileUrl": "https://example.com/lowres_1.mp4",
+            "fileUrl": "https://example.com/highres_1.mp4",
+            "isActive": True,
+            "tags": []
+        }
+    ]
+})
+
+# Tags API response fixture
+TAGS_DATA = [
+    {
+        "id": 1,
+        "name": "Test Tag",
+        "imageUrl": "https://example.com/tag_1.jpg"
+    }
+]
+
+# new_data.json fixtures for validate_json_data
+VALID_DATA = MappingProxyType({
+    "lastModified": "08/22/2025 08:46:06",
+    "videos": [
+        {
+            "id": "1",
+            "title": "Test",
+            "description": "Test",
+            "thumbnailKey": "thumb.jpg",
+            "thumbnailUrl": "https://example.com/thumb.jpg",
+            "fileKeyLow": "low.mp4",
+            "fileKey": "high.mp4",
+            "fileUrlLow": "https://example.com/low.mp4",
+            "fileUrl": "https://example.com/high.mp4",
+            "isActive": True,
+            "tags": []
+        }
+    ],
+    "tags": [
+        {
+            "id": 1,
+            "name": "Test Tag"
+        }
+    ]
+})
+
+# Fixed clock for generate_new_data_json and the document it should produce
+# from FILMS_DATA / TAGS_DATA at that instant
+FROZEN_NOW = datetime(2025, 8, 22, 8, 46, 6)
+EXPECTED_NEW_DATA = MappingProxyType({
+    "lastModified": "08/22/2025 08:46:06",
+    "videos": [
+        {
+            "id": "1",
+            "title": "Test Video",
+            "description": "Test Description",
+            "thumbnailKey": "thumb_1.jpg",
+            "thumbnailUrl": "https://example.com/thumb_1.jpg",
+            "fileKeyLow": "lowres_1.mp4",
+            "fileKey": "highres_1.mp4",
+            "fileUrlLow": "https://example.com/lowres_1.mp4",
+            "fileUrl": "https://example.com/highres_1.mp4",
+            "isActive": True,
+            "tags": []
+        }
+    ],
+    "tags": TAGS_DATA
+})
+
+INVALID_DATA = MappingProxyType({
+    "videos": [
+        {
+            "id": "1",
+            "title": "Test"
+            # Missing required keys
+        }
+    ],
+    "tags": []
+    # Missing lastModified
+})
+
+
+@pytest.fixture(scope='module')
+def default_config():
+    """Shared read-only default config"""
+    return get_default_config()
+
+
+@pytest.fixture(scope='module')
+def shared_content_manager():
+    """One ContentManager per module, built on a mutable copy of the defaults"""
+    return ContentManager(get_default_config_mut())
+
 
+@pytest.fixture
+def content_manager(shared_content_manager):
+    """Shared ContentManager with any auth state (or stored token) cleared"""
+    shared_content_manager.auth_token = None
+    shared_content_manager.user_info = None
+    shared_content_manager.company_info = None
+    return shared_content_manager
 
-class TestCLIBasics(unittest.TestCase):
-    """Test basic CLI functionality"""
+
+@pytest.fixture
+def ram_tmp_path():
+    """Temporary directory on tmpfs where available"""
+    with tempfile.TemporaryDirectory(dir=RAM_TMPDIR) as temp_dir:
+        yield temp_dir
+
+
+def test_default_config_loading(default_config):
+    """Test default configuration loading"""
+    assert {'backend', 'paths', 'devices', 'auth'} <= default_config.keys()
+    assert default_config['backend']['api_url'] == 'https://api.eldersvr.com'
+
+
+def test_default_config_cached_and_read_only():
+    """Shared default config is cached and immutable; the mutable variant is a private copy"""
+    config = get_default_config()
+    assert config is get_default_config()
+    with pytest.raises(TypeError):
+        config['backend']['api_url'] = 'https://other.example.com'
     
-    def test_default_config_loading(self):
-        """Test default configuration loading"""
-        config = get_default_config()
-        
-        self.assertIn('backend', config)
-        self.assertIn('paths', config)
-        self.assertIn('devices', config)
-        self.assertIn('auth', config)
-        
-        self.assertEqual(config['backend']['api_url'], 'https://api.eldersvr.com')
+    mutable = get_default_config_mut()
+    mutable['backend']['api_url'] = 'https://other.example.com'
+    assert get_default_config_mut()['backend']['api_url'] == 'https://api.eldersvr.com'
+
+
+def test_cli_default_config_uses_shared_defaults():
+    """The CLI's defaults come from the memoized config defaults, as private copies"""
+    from eldersvr_cli.cli import EldersVRCLI
+    cli = EldersVRCLI()
+    config = cli._get_default_config()
+    assert config == get_default_config_mut()
+    assert config['paths']['device_path'] == '/storage/emulated/0/Android/data/com.q42.eldersvr/files/EldersVR'
     
-    def test_config_loading_from_file(self):
-        """Test configuration loading from file"""
-        test_config = {
-            "backend": {"api_url": "https://test.api.com"},
-            "auth": {"email": "test@test.com", "password": "testpass"}
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(test_config, f)
-            config_path = f.name
-        
-        try:
-            config = load_config(config_path)
-            self.assertEqual(config['backend']['api_url'], 'https://test.api.com')
-            self.assertEqual(config['auth']['email'], 'test@test.com')
-        finally:
-            os.unlink(config_path)
-    
-    def test_adb_manager_initialization(self):
-        """Test ADB manager initialization"""
-        adb_manager = ADBManager()
-        
-        self.assertEqual(adb_manager.eldersvr_path, '/storage/emulated/0/Download/EldersVR')
-        self.assertEqual(adb_manager.video_path, '/storage/emulated/0/Download/EldersVR/Video')
-        self.assertEqual(adb_manager.image_path, '/storage/emulated/0/Download/EldersVR/Image')
-    
-    def test_adb_manager_custom_device_path(self):
-        """Test ADB manager initialization with custom device path"""
-        custom_path = "/sdcard/MyCustomPath"
-        adb_manager = ADBManager(custom_path)
-        
-        self.assertEqual(adb_manager.eldersvr_path, custom_path)
-        self.assertEqual(adb_manager.video_path, f"{custom_path}/Video")
-        self.assertEqual(adb_manager.image_path, f"{custom_path}/Image")
-    
-    def test_content_manager_initialization(self):
-        """Test content manager initialization"""
-        config = get_default_config()
-        content_manager = ContentManager(config)
+    config['paths']['device_path'] = '/sdcard/Other'
+    assert cli._get_default_config()['paths']['device_path'] != '/sdcard/Other'
+
+
+def test_config_loading_from_file():
+    """Test configuration loading from file"""
+    test_config = {
+        "backend": {"api_url": "https://test.api.com"},
+        "auth": {"email": "test@test.com", "password": "testpass"}
+    }
+    
+    # Serve the config from memory instead of a real temp file
+    with patch('eldersvr_cli.config.os.path.exists', return_value=True), \
+         patch('eldersvr_cli.config.open', mock_open(read_data=json.dumps(test_config)),
+               create=True) as mocked_open:
+        config = load_config('dummy.json')
+    
+    mocked_open.assert_called_once_with('dummy.json', 'r')
+    assert config['backend']['api_url'] == 'https://test.api.com'
+    assert config['auth']['email'] == 'test@test.com'
+
+
+def test_content_manager_initialization(default_config):
+    """Test content manager initialization"""
+    # Built fresh (not the shared fixture, which resets these fields itself)
+    with patch.object(ContentManager, '_load_stored_token') as mock_load:
+        content_manager = ContentManager(get_default_config_mut())
+    
+    mock_load.assert_called_once_with()
+    assert content_manager.config == default_config
+    assert content_manager.auth_token is None
+    assert content_manager.user_info is None
+    assert content_manager.company_info is None
+
+
+def test_cli_config_loading_uses_cache(ram_tmp_path):
+    """The CLI's config loading goes through the mtime cache and owns its copy"""
+    from eldersvr_cli.cli import EldersVRCLI
+    config_path = os.path.join(ram_tmp_path, 'config.json')
+    with open(config_path, 'w') as f:
+        json.dump({"backend": {"api_url": "https://test.api.com"}, "download": {"timeout": 30}}, f)
+    
+    with patch('eldersvr_cli.config.json.load', wraps=json.load) as mock_load:
+        first = EldersVRCLI().load_config(config_path)
+        first['download']['timeout'] = 5
+        second = EldersVRCLI().load_config(config_path)
+    
+    assert mock_load.call_count == 1
+    assert second['backend']['api_url'] == 'https://test.api.com'
+    assert second['download']['timeout'] == 30
+
+
+def test_config_loading_cached_by_mtime(ram_tmp_path):
+    """Unchanged config files are parsed once; each caller gets its own copy"""
+    config_path = os.path.join(ram_tmp_path, 'config.json')
+    with open(config_path, 'w') as f:
+        json.dump({"backend": {"api_url": "https://test.api.com"}}, f)
+    
+    with patch('eldersvr_cli.config.json.load', wraps=json.load) as mock_load:
+        first = load_config(config_path)
+        first['backend']['api_url'] = 'https://changed.example.com'
+        second = load_config(config_path)
+        assert mock_load.call_count == 1
+        assert second['backend']['api_url'] == 'https://test.api.com'
         
-        self.assertEqual(content_manager.config, config)
-        self.assertIsNone(content_manager.auth_token)
-        self.assertIsNone(content_manager.user_info)
-        self.assertIsNone(content_manager.company_info)
+        # A newer mtime invalidates the cached parse
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        load_config(config_path)
+        assert mock_load.call_count == 2
+
+
+def test_adb_devices_parsing_defaults():
+    """Test device rows without properties fall back to Unknown"""
+    output = ("List of devices attached\n"
+              "ABC123DEF456\toffline product:phone device:beyond1lte\n"
+              "XYZ789GHI012\tdevice\n")
+    
+    devices = ADBManager()._parse_devices_output(output)
+    
+    assert devices == [
+        {'serial': 'ABC123DEF456', 'status': 'offline', 'model': 'Unknown', 'product': 'phone'},
+        {'serial': 'XYZ789GHI012', 'status': 'device', 'model': 'Unknown', 'product': 'Unknown'},
+    ]
+
+
+@patch('socket.create_connection')
+def test_adb_devices_list_via_server(mock_connect):
+    """Test ADB devices listing over the ADB server socket"""
+    payload = (b"ABC123DEF456\tdevice product:phone model:Samsung_SM_G973F device:beyond1lte transport_id:1\n"
+               b"XYZ789GHI012\tdevice product:quest model:Meta_Quest_2 device:hollywood transport_id:2\n")
+    reply = io.BytesIO(b"OKAY" + b"%04x" % len(payload) + payload)
+    sock = mock_connect.return_value.__enter__.return_value
+    sock.recv.side_effect = reply.read
+    
+    adb_manager = ADBManager()
+    with patch('subprocess.run') as mock_run:
+        devices = adb_manager.get_connected_devices()
+        mock_run.assert_not_called()
+    
+    sock.sendall.assert_called_once_with(b"000ehost:devices-l")
+    assert len(devices) == 2
+    assert devices[0]['serial'] == 'ABC123DEF456'
+    assert devices[1]['model'] == 'Meta_Quest_2'
+
+
+@pytest.mark.parametrize("adb_path,expected", [
+    (None, False),
+    ('/usr/bin/adb', True),
+])
+@patch('socket.create_connection')
+def test_adb_available_requires_binary(mock_connect, adb_path, expected):
+    """Test a running ADB server only counts when the adb binary is on PATH"""
+    payload = b"0029"
+    reply = io.BytesIO(b"OKAY" + b"%04x" % len(payload) + payload)
+    mock_connect.return_value.__enter__.return_value.recv.side_effect = reply.read
+    
+    adb_manager = ADBManager()
+    with patch('eldersvr_cli.core.adb_manager.shutil.which', return_value=adb_path), \
+         patch('subprocess.run') as mock_run:
+        assert adb_manager.verify_adb_available() is expected
+        mock_run.assert_not_called()
+
+
+@pytest.mark.parametrize("env,expected", [
+    ({}, ('127.0.0.1', 5037)),
+    ({'ANDROID_ADB_SERVER_PORT': '5038'}, ('127.0.0.1', 5038)),
+])
+def test_adb_server_address_follows_env(env, expected):
+    """Test the server socket uses the same port as the adb binary"""
+    with patch.dict(os.environ, env, clear=True):
+        assert ADBManager._adb_server_address() == expected
+
+
+def test_adb_server_address_invalid_port():
+    """Test an invalid server port raises OSError so adb runs as fallback"""
+    with patch.dict(os.environ, {'ANDROID_ADB_SERVER_PORT': 'abc'}, clear=True), \
+         pytest.raises(OSError):
+        ADBManager._adb_server_address()
+
+
+@patch('subprocess.Popen')
+def test_adb_push_batch(mock_popen, ram_tmp_path):
+    """Test batched push spawns one adb process per batch"""
+    mock_popen.return_value.stdin = io.BytesIO()
+    mock_popen.return_value.communicate.return_value = (b'', b'')
+    mock_popen.return_value.returncode = 0
+    
+    local_files = []
+    for i in range(5):
+        path = os.path.join(ram_tmp_path, f"image_{i}.jpg")
+        with open(path, 'wb') as f:
+            f.write(b'data')
+        local_files.append(path)
+    
+    adb_manager = ADBManager()
+    success, total = adb_manager.push_batch('ABC123', local_files, adb_manager.image_path, batch_size=2)
+    
+    assert (success, total) == (5, 5)
+    assert mock_popen.call_count == 3
+    args = mock_popen.call_args[0][0]
+    assert args[:4] == ['adb', '-s', 'ABC123', 'exec-in']
+    assert 'tar -xf -' in args[4]
+    # Device output is discarded so it can never block the tar writer
+    assert mock_popen.call_args.kwargs['stdout'] == subprocess.DEVNULL
+
+
+@patch('subprocess.Popen')
+def test_adb_push_images_streams_batches(mock_popen, ram_tmp_path):
+    """Test images are pushed as tar batches with skipped files left out"""
+    mock_popen.return_value.stdin = io.BytesIO()
+    mock_popen.return_value.communicate.return_value = (None, b'')
+    mock_popen.return_value.returncode = 0
+    
+    for i in range(3):
+        with open(os.path.join(ram_tmp_path, f"image_{i}.jpg"), 'wb') as f:
+            f.write(b'data')
+    
+    adb_manager = ADBManager()
+    progress = Mock()
+    success, total = adb_manager.push_images('ABC123', ram_tmp_path, progress, None, {'image_1.jpg'})
+    
+    assert (success, total) == (2, 3)
+    mock_popen.assert_called_once()
+    args = mock_popen.call_args[0][0]
+    assert args[:4] == ['adb', '-s', 'ABC123', 'exec-in']
+    assert adb_manager.image_path in args[4]
+    progress.assert_called_with(3, 3, 100)
+
+
+@patch('subprocess.Popen')
+def test_adb_push_videos_filtered_streams_batches(mock_popen, ram_tmp_path):
+    """Test filtered videos are pushed as tar batches, one progress report per batch"""
+    mock_popen.return_value.stdin = io.BytesIO()
+    mock_popen.return_value.communicate.return_value = (None, b'')
+    mock_popen.return_value.returncode = 0
+    
+    names = [f"lowres_{i}.mp4" for i in range(7)]
+    for name in names:
+        with open(os.path.join(ram_tmp_path, name), 'wb') as f:
+            f.write(b'data')
+    
+    adb_manager = ADBManager()
+    progress = Mock()
+    success, total = adb_manager.push_videos_filtered('ABC123', ram_tmp_path, names, progress)
+    
+    assert (success, total) == (7, 7)
+    # Seven files in batches of five
+    assert mock_popen.call_count == 2
+    assert adb_manager.video_path in mock_popen.call_args[0][0][4]
+    assert [c.args for c in progress.call_args_list] == [(5, 7, 100), (7, 7, 100)]
+
+
+@patch('subprocess.Popen')
+def test_adb_push_batch_failure_logs_decoded_stderr(mock_popen, ram_tmp_path):
+    """Test a failed batch is reported with its stderr as text"""
+    mock_popen.return_value.stdin = io.BytesIO()
+    mock_popen.return_value.communicate.return_value = (None, b'tar: write error\n')
+    mock_popen.return_value.returncode = 1
+    
+    path = os.path.join(ram_tmp_path, "image_0.jpg")
+    with open(path, 'wb') as f:
+        f.write(b'data')
+    
+    adb_manager = ADBManager()
+    with patch.object(adb_manager, 'logger') as mock_logger:
+        success, total = adb_manager.push_batch('ABC123', [path], adb_manager.image_path)
+    
+    assert (success, total) == (0, 1)
+    mock_logger.warning.assert_called_once_with("❌ Batch transfer failed: tar: write error")
+
+
+def test_new_data_json_generation(content_manager):
+    """Test new_data.json generation"""
+    # Capture the write in memory instead of touching the filesystem and pin
+    # the clock; the stdlib json writer is forced so the check holds with or
+    # without orjson
+    downloads = '/downloads'
+    with patch.dict(content_manager.config['paths'], local_downloads=downloads), \
+         patch('eldersvr_cli.core.content_manager.orjson', None), \
+         patch('eldersvr_cli.core.content_manager.datetime') as mock_datetime, \
+         patch('eldersvr_cli.core.content_manager.os.makedirs') as mock_makedirs, \
+         patch('eldersvr_cli.core.content_manager.open', mock_open(), create=True) as mocked_open:
+        mock_datetime.now.return_value = FROZEN_NOW
+        result = content_manager.generate_new_data_json(FILMS_DATA, TAGS_DATA)
+    
+    assert result == EXPECTED_NEW_DATA
+    
+    # Check the file was written once with the returned data
+    mock_makedirs.assert_called_once_with(downloads, exist_ok=True)
+    mocked_open.assert_called_once_with(f"{downloads}/new_data.json", "w", encoding='utf-8')
+    written = ''.join(call.args[0] for call in mocked_open().write.call_args_list)
+    assert json.loads(written) == result
+
+
+@pytest.mark.skipif(content_manager_module.orjson is None, reason="orjson not installed")
+def test_new_data_json_generation_orjson(content_manager):
+    """Test new_data.json is written in one orjson-encoded call when available"""
+    downloads = '/downloads'
+    with patch.dict(content_manager.config['paths'], local_downloads=downloads), \
+         patch('eldersvr_cli.core.content_manager.datetime') as mock_datetime, \
+         patch('eldersvr_cli.core.content_manager.os.makedirs'), \
+         patch('eldersvr_cli.core.content_manager.Path.write_bytes', autospec=True) as mock_write:
+        mock_datetime.now.return_value = FROZEN_NOW
+        result = content_manager.generate_new_data_json(FILMS_DATA, TAGS_DATA)
+    
+    path, data = mock_write.call_args.args
+    assert str(path) == f"{downloads}/new_data.json"
+    assert isinstance(data, bytes)
+    assert result == EXPECTED_NEW_DATA
+    assert json.loads(data) == result
+
+
+def test_data_validation(content_manager):
+    """Test JSON data validation"""
+    issues = content_manager.validate_json_data(VALID_DATA)
+    assert len(issues) == 0
+    
+    issues = content_manager.validate_json_data(INVALID_DATA)
+    assert len(issues) > 0
+    assert "Missing required key: lastModified" in set(issues)
+
+
+@pytest.mark.parametrize("path,expected", [
+    (None, '/storage/emulated/0/Android/data/com.q42.eldersvr/files/EldersVR'),
+    ('/sdcard/MyCustomPath', '/sdcard/MyCustomPath'),
+])
+def test_adb_manager_paths(path, expected):
+    """Test ADB manager path setup for the default and a custom device path"""
+    adb_manager = ADBManager() if path is None else ADBManager(path)
+    
+    assert adb_manager.eldersvr_path == expected
+    assert adb_manager.video_path == f"{expected}/Video"
+    assert adb_manager.image_path == f"{expected}/Image"
+    assert adb_manager.json_path == f"{expected}/new_data.json"
+    assert adb_manager.credential_path == f"{expected}/credential.json"
+    assert adb_manager.remote_video_path("a.mp4") == f"{expected}/Video/a.mp4"
+    assert adb_manager.remote_image_path("b.jpg") == f"{expected}/Image/b.jpg"
+
+
+@pytest.mark.parametrize("json_only,expected_sections", [
+    (True, ()),
+    (False, (('Video Files', 'videos'), ('Image Files', 'images'))),
+])
+def test_transfer_json_only_hides_media_rows(json_only, expected_sections):
+    """Test --json-only registers devices without video or image rows"""
+    from argparse import Namespace
+    from eldersvr_cli.cli import EldersVRCLI
+    cli = EldersVRCLI()
+    cli.config = get_default_config_mut()
+    cli.config['devices'] = {'master_serial': 'MASTER123', 'slave_serial': 'SLAVE456'}
+    cli._initialize_managers()
+    args = Namespace(json_only=json_only, slave_only=False, master_only=False)
+    
+    with patch.object(cli, '_preflight_check', return_value=True), \
+         patch.object(cli, '_transfer_to_master', return_value=True) as mock_master, \
+         patch.object(cli, '_transfer_to_slave', return_value=True), \
+         patch('eldersvr_cli.cli.print_deployment_summary'):
+        assert cli.cmd_transfer(args) == 0
+    
+    progress = mock_master.call_args.args[1]
+    assert progress._sections == [expected_sections, expected_sections]
+
+
+@patch('eldersvr_cli.core.adb_manager.subprocess.run')
+class TestADBSubprocess(unittest.TestCase):
+    """Test ADBManager queries that shell out to the adb binary"""
     
-    @patch('subprocess.run')
     def test_adb_version_check(self, mock_run):
         """Test ADB version check"""
         # Mock successful ADB version check
-        mock_run.return_value.returncode = 0
+        mock_run.return_value = ADB_OK_EMPTY
         
-        adb_manager = ADBManager()
+        adb_manager = ADBManager(use_subprocess=True)
         result = adb_manager.verify_adb_available()
         
         self.assertTrue(result)
         mock_run.assert_called_once()
     
-    @patch('subprocess.run')
     def test_adb_devices_list(self, mock_run):
         """Test ADB devices listing"""
         # Mock ADB devices output
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = """List of devices attached
-ABC123DEF456	device product:phone model:Samsung_SM_G973F device:beyond1lte
-XYZ789GHI012	device product:quest model:Meta_Quest_2 device:hollywood
-"""
+        mock_run.return_value = ADB_OK_DEVICES
         
-        adb_manager = ADBManager()
+        adb_manager = ADBManager(use_subprocess=True)
         devices = adb_manager.get_connected_devices()
         
         self.assertEqual(len(devices), 2)
@@ -101,117 +536,6 @@ XYZ789GHI012	device product:quest model:Meta_Quest_2 device:hollywood
         self.assertEqual(devices[0]['model'], 'Samsung_SM_G973F')
         self.assertEqual(devices[1]['serial'], 'XYZ789GHI012')
         self.assertEqual(devices[1]['model'], 'Meta_Quest_2')
-    
-    def test_new_data_json_generation(self):
-        """Test new_data.json generation"""
-        config = get_default_config()
-        content_manager = ContentManager(config)
-        
-        # Mock film data
-        films_data = {
-            "films": [
-                {
-                    "id": 1,
-                    "title": "Test Video",
-                    "description": "Test Description",
-                    "thumbnailKey": "thumb_1.jpg",
-                    "thumbnailUrl": "https://example.com/thumb_1.jpg",
-                    "lowQualityFileKey": "lowres_1.mp4",
-                    "fileKey": "highres_1.mp4",
-                    "lowQualityFileUrl": "https://example.com/lowres_1.mp4",
-                    "fileUrl": "https://example.com/highres_1.mp4",
-                    "isActive": True,
-                    "tags": []
-                }
-            ]
-        }
-        
-        # Mock tags data
-        tags_data = [
-            {
-                "id": 1,
-                "name": "Test Tag",
-                "imageUrl": "https://example.com/tag_1.jpg"
-            }
-        ]
-        
-        # Create temporary downloads directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config['paths']['local_downloads'] = temp_dir
-            
-            result = content_manager.generate_new_data_json(films_data, tags_data)
-            
-            # Check structure
-            self.assertIn('lastModified', result)
-            self.assertIn('videos', result)
-            self.assertIn('tags', result)
-            
-            # Check video transformation
-            self.assertEqual(len(result['videos']), 1)
-            video = result['videos'][0]
-            self.assertEqual(video['id'], '1')
-            self.assertEqual(video['title'], 'Test Video')
-            self.assertEqual(video['fileKey'], 'highres_1.mp4')
-            self.assertEqual(video['fileKeyLow'], 'lowres_1.mp4')
-            
-            # Check tags
-            self.assertEqual(len(result['tags']), 1)
-            self.assertEqual(result['tags'][0]['name'], 'Test Tag')
-            
-            # Check file was created
-            json_file = os.path.join(temp_dir, 'new_data.json')
-            self.assertTrue(os.path.exists(json_file))
-    
-    def test_data_validation(self):
-        """Test JSON data validation"""
-        config = get_default_config()
-        content_manager = ContentManager(config)
-        
-        # Valid data
-        valid_data = {
-            "lastModified": "08/22/2025 08:46:06",
-            "videos": [
-                {
-                    "id": "1",
-                    "title": "Test",
-                    "description": "Test",
-                    "thumbnailKey": "thumb.jpg",
-                    "thumbnailUrl": "https://example.com/thumb.jpg",
-                    "fileKeyLow": "low.mp4",
-                    "fileKey": "high.mp4",
-                    "fileUrlLow": "https://example.com/low.mp4",
-                    "fileUrl": "https://example.com/high.mp4",
-                    "isActive": True,
-                    "tags": []
-                }
-            ],
-            "tags": [
-                {
-                    "id": 1,
-                    "name": "Test Tag"
-                }
-            ]
-        }
-        
-        issues = content_manager.validate_json_data(valid_data)
-        self.assertEqual(len(issues), 0)
-        
-        # Invalid data - missing keys
-        invalid_data = {
-            "videos": [
-                {
-                    "id": "1",
-                    "title": "Test"
-                    # Missing required keys
-                }
-            ],
-            "tags": []
-            # Missing lastModified
-        }
-        
-        issues = content_manager.validate_json_data(invalid_data)
-        self.assertGreater(len(issues), 0)
-        self.assertTrue(any("Missing required key: lastModified" in issue for issue in issues))
 
 
 class TestConfigValidation(unittest.TestCase):
@@ -220,7 +544,7 @@ class TestConfigValidation(unittest.TestCase):
     def setUp(self):
         from eldersvr_cli.cli import EldersVRCLI
         self.cli = EldersVRCLI()
-        self.cli.config = get_default_config()
+        self.cli.config = get_default_config_mut()
 
     def test_valid_config_passes(self):
         """Valid default config should have no issues"""
@@ -279,11 +603,16 @@ class TestConfigValidation(unittest.TestCase):
         self.assertFalse(any('username or email' in i for i in issues))
 
 
+@unittest.skipUnless(RUN_CONTENT_TESTS, "ContentManager tests disabled (RUN_CONTENT_TESTS=0)")
 class TestContentManagerValidation(unittest.TestCase):
     """Test ContentManager validation methods"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Read-only and never mutated by these tests, so shared as-is
+        cls.config = get_default_config()
+
     def setUp(self):
-        self.config = get_default_config()
         self.cm = ContentManager(self.config)
 
     @patch.object(ContentManager, '_load_stored_token')
@@ -317,6 +646,40 @@ class TestContentManagerValidation(unittest.TestCase):
         self.assertFalse(reachable)
         self.assertIn('timed out', msg)
 
+    def test_upload_json_posts_encoded_body(self):
+        """JSON bodies of any size are posted as one bytes body with a Content-Length"""
+        self.cm.session.post = Mock()
+
+        for obj in ({'password': 'secret', 'username': 'admin'},
+                    {'videos': [{'id': i, 'title': 'x' * 100} for i in range(1000)]}):
+            self.cm._upload_json('https://api.example.com/auth', obj)
+            kwargs = self.cm.session.post.call_args.kwargs
+            self.assertIsInstance(kwargs['data'], bytes)
+            self.assertEqual(json.loads(kwargs['data']), obj)
+            self.assertEqual(kwargs['headers'], {'Content-Type': 'application/json'})
+
+    def test_download_file_uses_pooled_download_session(self):
+        """Asset downloads go through the download session, not the API session"""
+        pool = self.cm._download_session.get_adapter('https://cdn.example.com').poolmanager
+        self.assertEqual(pool.connection_pool_kw['maxsize'], self.cm.max_concurrent_downloads)
+        self.assertNotIn('Authorization', self.cm._download_session.headers)
+
+        response = Mock()
+        response.headers = {'content-length': '4'}
+        response.iter_content.return_value = [b'da', b'ta']
+        self.cm._download_session.get = Mock(return_value=response)
+        self.cm.session.get = Mock()
+
+        with patch('eldersvr_cli.core.content_manager.os.makedirs'), \
+             patch('eldersvr_cli.core.content_manager.open', mock_open(), create=True) as mocked_open:
+            ok = self.cm.download_file('https://cdn.example.com/video.mp4', '/downloads/video.mp4')
+
+        self.assertTrue(ok)
+        self.cm._download_session.get.assert_called_once_with(
+            'https://cdn.example.com/video.mp4', stream=True, timeout=self.cm.timeout)
+        self.cm.session.get.assert_not_called()
+        mocked_open().write.assert_any_call(b'ta')
+
     @patch.object(ContentManager, '_load_stored_token')
     def test_validate_token_no_token(self, mock_load):
         """Token validation fails when no token is stored"""
@@ -365,10 +728,17 @@ class TestContentManagerValidation(unittest.TestCase):
 class TestPreflightCheck(unittest.TestCase):
     """Test CLI preflight check orchestration"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._base_config = get_default_config_mut()
+        cls._mock_cm = create_autospec(ContentManager, instance=True)
+
     def setUp(self):
         from eldersvr_cli.cli import EldersVRCLI
         self.cli = EldersVRCLI()
-        self.cli.config = get_default_config()
+        self.cli.config = copy.deepcopy(self._base_config)
+        self._mock_cm.reset_mock(return_value=True, side_effect=True)
+        self.cli.content_manager = self._mock_cm
         self.cli.config['devices'] = {
             'master_serial': 'MASTER123',
             'slave_serial': 'SLAVE456'
@@ -388,9 +758,8 @@ class TestPreflightCheck(unittest.TestCase):
     @patch.object(ContentManager, '_load_stored_token')
     def test_preflight_api_pass(self, mock_load):
         """Preflight API check passes when reachable"""
-        mock_cm = Mock()
+        mock_cm = self._mock_cm
         mock_cm.check_api_connectivity.return_value = (True, "API reachable")
-        self.cli.content_manager = mock_cm
 
         result = self.cli._preflight_check(['api'])
         self.assertTrue(result)
@@ -398,9 +767,8 @@ class TestPreflightCheck(unittest.TestCase):
     @patch.object(ContentManager, '_load_stored_token')
     def test_preflight_api_fail(self, mock_load):
         """Preflight API check fails when unreachable"""
-        mock_cm = Mock()
+        mock_cm = self._mock_cm
         mock_cm.check_api_connectivity.return_value = (False, "Cannot connect")
-        self.cli.content_manager = mock_cm
 
         result = self.cli._preflight_check(['api'])
         self.assertFalse(result)
@@ -408,10 +776,9 @@ class TestPreflightCheck(unittest.TestCase):
     @patch.object(ContentManager, '_load_stored_token')
     def test_preflight_auth_pass(self, mock_load):
         """Preflight auth check passes with valid token"""
-        mock_cm = Mock()
+        mock_cm = self._mock_cm
         mock_cm.check_api_connectivity.return_value = (True, "API reachable")
         mock_cm.validate_token.return_value = (True, "Token valid")
-        self.cli.content_manager = mock_cm
 
         result = self.cli._preflight_check(['auth'])
         self.assertTrue(result)
@@ -419,10 +786,9 @@ class TestPreflightCheck(unittest.TestCase):
     @patch.object(ContentManager, '_load_stored_token')
     def test_preflight_auth_fail_expired(self, mock_load):
         """Preflight auth check fails with expired token"""
-        mock_cm = Mock()
+        mock_cm = self._mock_cm
         mock_cm.check_api_connectivity.return_value = (True, "API reachable")
         mock_cm.validate_token.return_value = (False, "Token expired")
-        self.cli.content_manager = mock_cm
 
         result = self.cli._preflight_check(['auth'])
         self.assertFalse(result)
@@ -430,15 +796,65 @@ class TestPreflightCheck(unittest.TestCase):
     @patch.object(ContentManager, '_load_stored_token')
     def test_preflight_auth_skipped_when_api_unreachable(self, mock_load):
         """Auth check is skipped when API is unreachable"""
-        mock_cm = Mock()
+        mock_cm = self._mock_cm
         mock_cm.check_api_connectivity.return_value = (False, "Cannot connect")
-        self.cli.content_manager = mock_cm
 
         result = self.cli._preflight_check(['auth'])
         self.assertFalse(result)
         # validate_token should not be called since API is down
         mock_cm.validate_token.assert_not_called()
 
+    @patch('subprocess.run')
+    def test_preflight_independent_checks_run_when_api_unreachable(self, mock_run):
+        """Data and devices are still checked when the API is down; auth is skipped"""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stderr='',
+            stdout="List of devices attached\nMASTER123\tdevice product:phone model:SM device:beyond\n"
+                   "SLAVE456\tdevice product:quest model:Quest device:hollywood\n")
+        mock_cm = self._mock_cm
+        mock_cm.check_api_connectivity.return_value = (False, "Cannot connect")
+        mock_cm.validate_json_data.return_value = []
+        self.cli._ensure_managers_initialized()
+        self.cli.adb_manager.use_subprocess = True
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.cli.config['paths']['local_downloads'] = temp_dir
+            json_file = os.path.join(temp_dir, 'new_data.json')
+            with open(json_file, 'w') as f:
+                json.dump({"lastModified": "01/01/2026", "videos": [], "tags": []}, f)
+
+            with patch.object(self.cli, 'logger') as mock_logger:
+                result = self.cli._preflight_check(['api', 'auth', 'data', 'devices'])
+
+        self.assertFalse(result)
+        mock_cm.validate_token.assert_not_called()
+        errors = [c.args[0] for c in mock_logger.error.call_args_list]
+        infos = [c.args[0] for c in mock_logger.info.call_args_list]
+        self.assertIn("[FAIL] Cannot connect", errors)
+        self.assertIn("[SKIP] Auth validation skipped (API unreachable)", errors)
+        self.assertIn(f"[PASS] {json_file} is valid", infos)
+        self.assertIn("[PASS] Master device MASTER123 connected", infos)
+        self.assertIn("[PASS] Slave device SLAVE456 connected", infos)
+
+    def test_preflight_api_pass_is_cached(self):
+        """A passing API check is reused until its TTL expires"""
+        mock_cm = self._mock_cm
+        mock_cm.check_api_connectivity.return_value = (True, "API reachable")
+
+        self.assertTrue(self.cli._preflight_check(['api']))
+        self.assertTrue(self.cli._preflight_check(['api']))
+        self.assertEqual(mock_cm.check_api_connectivity.call_count, 1)
+
+        # Editing the backend config invalidates the cached result
+        self.cli.config['backend']['api_url'] = 'https://staging.eldersvr.com'
+        self.assertTrue(self.cli._preflight_check(['api']))
+        self.assertEqual(mock_cm.check_api_connectivity.call_count, 2)
+
+        # A zero TTL disables memoization entirely
+        self.cli._preflight_ttl['api'] = 0
+        self.assertTrue(self.cli._preflight_check(['api']))
+        self.assertEqual(mock_cm.check_api_connectivity.call_count, 3)
+
     def test_preflight_data_pass(self):
         """Preflight data check passes with valid new_data.json"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -452,9 +868,8 @@ class TestPreflightCheck(unittest.TestCase):
             with open(json_file, 'w') as f:
                 json.dump(valid_data, f)
 
-            mock_cm = Mock()
+            mock_cm = self._mock_cm
             mock_cm.validate_json_data.return_value = []
-            self.cli.content_manager = mock_cm
 
             result = self.cli._preflight_check(['data'])
             self.assertTrue(result)
@@ -476,6 +891,7 @@ MASTER123\tdevice product:phone model:SM device:beyond
 SLAVE456\tdevice product:quest model:Quest device:hollywood
 """
         self.cli._ensure_managers_initialized()
+        self.cli.adb_manager.use_subprocess = True
 
         result = self.cli._preflight_check(['devices'])
         self.assertTrue(result)
@@ -488,6 +904,7 @@ SLAVE456\tdevice product:quest model:Quest device:hollywood
 MASTER123\tdevice product:phone model:SM device:beyond
 """
         self.cli._ensure_managers_initialized()
+        self.cli.adb_manager.use_subprocess = True
 
         result = self.cli._preflight_check(['devices'])
         self.assertTrue(result)
@@ -499,6 +916,7 @@ MASTER123\tdevice product:phone model:SM device:beyond
         mock_run.return_value.stdout = """List of devices attached
 """
         self.cli._ensure_managers_initialized()
+        self.cli.adb_manager.use_subprocess = True
 
         result = self.cli._preflight_check(['devices'])
         self.assertFalse(result)
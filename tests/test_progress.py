@@ -0,0 +1,262 @@
+"""
+Tests for transfer progress tracking
+"""
+
+import importlib.util
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from eldersvr_cli.utils.progress import DownloadProgressTable, TransferProgress, _LiveFrame
+
+
+def _load_demo_script():
+    """Load the repo-root progress demo by path; it shares this module's basename"""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test_progress.py')
+    spec = importlib.util.spec_from_file_location('progress_demo', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+simulate_transfer = _load_demo_script().simulate_transfer
+
+
+class VirtualClock:
+    """Clock that only advances when slept on"""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+class TestTransferProgress(unittest.TestCase):
+    """Test TransferProgress driven by a virtual clock"""
+
+    def test_simulated_transfer_summary(self):
+        """Simulated transfer completes without wall-clock sleeps"""
+        clock = VirtualClock()
+        summary = simulate_transfer(sleep=clock.sleep, clock=clock)
+
+        self.assertEqual(summary['total_devices'], 2)
+        self.assertEqual(summary['completed_devices'], 2)
+        self.assertEqual(summary['failed_transfers'], 0)
+        # Per device: new_data.json + 10 videos + 20 images
+        self.assertEqual(summary['total_files'], 62)
+        self.assertEqual(summary['completed_files'], 62)
+        self.assertGreater(clock.now, 1000.0)
+
+    def test_elapsed_time_from_clock_zero(self):
+        """A start time of 0.0 on the injected clock still counts as started"""
+        clock = VirtualClock(start=0.0)
+        progress = TransferProgress(clock=clock)
+        progress.add_device("SERIAL0", "Quest 0")
+
+        stdout = io.StringIO()
+        with patch('eldersvr_cli.utils.progress.sys.stdout', stdout):
+            progress.update_json_status("SERIAL0", 'in_progress')
+            self.assertIn("[0.0s]", stdout.getvalue())
+
+            clock.sleep(5)
+            progress.update_videos_progress("SERIAL0", 1, 4)
+            stdout.seek(0)
+            stdout.truncate()
+            progress._display_progress_realtime(force=True)
+
+        self.assertIn("JSON File:", stdout.getvalue())
+        self.assertIn("[5.0s]", stdout.getvalue())
+
+    def test_device_without_videos_has_no_video_row(self):
+        """Only the file categories a device receives are rendered"""
+        progress = TransferProgress(clock=VirtualClock())
+        progress.add_device("SERIAL0", "Quest 0", has_videos=False)
+
+        stdout = io.StringIO()
+        with patch('eldersvr_cli.utils.progress.sys.stdout', stdout):
+            progress.update_json_status("SERIAL0", 'completed', 1024)
+
+        frame = stdout.getvalue()
+        self.assertNotIn("Video Files", frame)
+        self.assertIn("Image Files", frame)
+
+    def test_large_fleet_condenses_inactive_devices(self):
+        """Above max_display_devices only active devices get full detail"""
+        progress = TransferProgress(max_display_devices=4, clock=VirtualClock())
+        for n in range(5):
+            progress.add_device(f"SERIAL{n}", f"Quest {n}")
+
+        stdout = io.StringIO()
+        with patch('eldersvr_cli.utils.progress.sys.stdout', stdout):
+            # Fully transferred
+            progress.update_json_status("SERIAL0", 'completed', 1024)
+            progress.update_videos_progress("SERIAL0", 3, 3, 'completed')
+            progress.update_images_progress("SERIAL0", 5, 5, 'completed')
+            # JSON only; untouched categories count as not applicable
+            progress.update_json_status("SERIAL1", 'completed', 1024)
+            progress.update_json_status("SERIAL2", 'failed')
+            progress.update_json_status("SERIAL3", 'in_progress')
+            # SERIAL4 stays pending
+            stdout.seek(0)
+            stdout.truncate()
+            progress._display_progress_realtime(force=True)
+
+        self.assertEqual(progress._active_serials, {"SERIAL3"})
+        self.assertEqual(progress._completed_serials, {"SERIAL0", "SERIAL1"})
+        self.assertEqual(progress._failed_serials, {"SERIAL2"})
+
+        frame = stdout.getvalue()
+        self.assertIn("2/5 devices complete | 1 failed | 4 not transferring", frame)
+        self.assertIn("[Quest 3 - SERIAL3]", frame)
+        for serial in ("SERIAL0", "SERIAL1", "SERIAL2", "SERIAL4"):
+            self.assertNotIn(serial, frame)
+
+        summary = progress.get_summary()
+        self.assertEqual(summary['total_devices'], 5)
+        self.assertEqual(summary['completed_devices'], 2)
+        self.assertEqual(summary['failed_transfers'], 1)
+
+        # A finished device leaves the active set and joins the completed one
+        with patch('eldersvr_cli.utils.progress.sys.stdout', io.StringIO()):
+            progress.update_json_status("SERIAL3", 'completed', 1024)
+        self.assertEqual(progress._active_serials, set())
+        self.assertEqual(progress._completed_serials, {"SERIAL0", "SERIAL1", "SERIAL3"})
+
+
+class TestDownloadProgressTable(unittest.TestCase):
+    """Test DownloadProgressTable update coalescing"""
+
+    def setUp(self):
+        self.table = DownloadProgressTable()
+        # Never repaint; these tests only look at tracked state
+        self.table.update_interval = float('inf')
+        self.table.add_download('video.mp4', 'video')
+        self.table.update_download('video.mp4', 5_000_000, 10_000_000)
+
+    def test_small_forward_delta_is_coalesced(self):
+        """Updates below the reporting threshold are dropped"""
+        self.table.update_download('video.mp4', 5_001_000, 10_000_000)
+
+        download = self.table.downloads['video.mp4']
+        self.assertEqual(download['size_downloaded'], 5_000_000)
+        self.assertEqual(self.table.get_summary()['total_downloaded'], 5_000_000)
+
+    def test_large_forward_delta_is_applied(self):
+        """Updates past the reporting threshold are applied"""
+        self.table.update_download('video.mp4', 6_000_000, 10_000_000)
+
+        download = self.table.downloads['video.mp4']
+        self.assertEqual(download['size_downloaded'], 6_000_000)
+        self.assertEqual(download['progress'], 60.0)
+        self.assertEqual(self.table.get_summary()['total_downloaded'], 6_000_000)
+
+    def test_restarted_download_is_applied(self):
+        """A retry restarting its byte count is never coalesced away"""
+        self.table.update_download('video.mp4', 1_000, 10_000_000)
+
+        download = self.table.downloads['video.mp4']
+        self.assertEqual(download['size_downloaded'], 1_000)
+        self.assertEqual(download['progress'], 0.01)
+        self.assertEqual(self.table.get_summary()['total_downloaded'], 1_000)
+
+
+class TestDownloadProgressCounters(unittest.TestCase):
+    """Test the incrementally maintained DownloadProgressTable counters"""
+
+    def setUp(self):
+        self.table = DownloadProgressTable()
+        # Never repaint; these tests only look at tracked state
+        self.table.update_interval = float('inf')
+
+    def assertCounts(self, pending=0, downloading=0, completed=0, failed=0, total_downloaded=0):
+        summary = self.table.get_summary()
+        self.assertEqual(
+            (summary['pending'], summary['downloading'], summary['completed'],
+             summary['failed'], summary['total_downloaded']),
+            (pending, downloading, completed, failed, total_downloaded))
+
+    def test_progress_through_completion(self):
+        """Counts move with each status change"""
+        self.table.add_download('a.mp4', 'video')
+        self.table.add_download('b.jpg', 'image')
+        self.assertCounts(pending=2)
+
+        self.table.update_download('a.mp4', 400_000, 1_000_000)
+        self.assertCounts(pending=1, downloading=1, total_downloaded=400_000)
+
+        self.table.mark_completed('a.mp4')
+        self.assertCounts(pending=1, completed=1, total_downloaded=1_000_000)
+        self.assertEqual(self.table.get_summary()['total_files'], 2)
+
+    def test_readding_download_resets_its_counts(self):
+        """Re-adding a tracked file drops its old status and bytes"""
+        self.table.add_download('a.mp4', 'video')
+        self.table.update_download('a.mp4', 400_000, 1_000_000)
+
+        self.table.add_download('a.mp4', 'video')
+
+        self.assertCounts(pending=1)
+        self.assertEqual(self.table.get_summary()['total_files'], 1)
+        self.assertEqual(self.table.downloads['a.mp4']['size_downloaded'], 0)
+
+    def test_failed_download(self):
+        """A failure moves the file out of downloading and records the error"""
+        self.table.add_download('a.mp4', 'video')
+        self.table.update_download('a.mp4', 400_000, 1_000_000)
+
+        self.table.mark_completed('a.mp4', success=False, error='HTTP 404')
+
+        self.assertCounts(failed=1, total_downloaded=400_000)
+        self.assertEqual(self.table.downloads['a.mp4']['error'], 'HTTP 404')
+
+    def test_failed_status_update(self):
+        """A 'failed' status from update_download is counted once"""
+        self.table.add_download('a.mp4', 'video')
+        self.table.update_download('a.mp4', 0, 1_000_000, 'failed')
+
+        self.assertCounts(failed=1)
+
+    def test_mark_completed_after_completed_update(self):
+        """Marking an already completed download does not count it twice"""
+        self.table.add_download('a.mp4', 'video')
+        self.table.update_download('a.mp4', 1_000_000, 1_000_000, 'completed')
+        self.assertCounts(completed=1, total_downloaded=1_000_000)
+
+        self.table.mark_completed('a.mp4')
+
+        self.assertCounts(completed=1, total_downloaded=1_000_000)
+
+    def test_unknown_length_download_is_not_coalesced(self):
+        """Without a content-length every chunk is counted"""
+        self.table.add_download('image.jpg', 'image')
+        self.table.update_download('image.jpg', 0, 1)
+        for downloaded in range(8192, 98304 + 1, 8192):
+            self.table.update_download('image.jpg', downloaded, 0)
+        self.table.mark_completed('image.jpg')
+
+        self.assertCounts(completed=1, total_downloaded=98304)
+
+
+class TestLiveFrame(unittest.TestCase):
+    """Test how frames reach the terminal"""
+
+    @patch('eldersvr_cli.utils.progress.os.write')
+    def test_non_posix_frames_use_text_stdout(self, mock_write):
+        """Off POSIX the frame goes through sys.stdout, not the raw descriptor"""
+        stdout = io.StringIO()
+        stdout.fileno = lambda: 1
+        with patch('eldersvr_cli.utils.progress.os.name', 'nt'), \
+             patch('eldersvr_cli.utils.progress.sys.stdout', stdout):
+            _LiveFrame()._emit("✅ █░")
+
+        mock_write.assert_not_called()
+        self.assertEqual(stdout.getvalue(), "✅ █░")
+
+
+if __name__ == '__main__':
+    unittest.main()